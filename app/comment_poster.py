@@ -5,9 +5,18 @@ Posts inline review comments and commit statuses to GitHub PRs.
 """
 
 import os
+import sys
 import subprocess
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional
+
+
+class ExistingCommentLocation(NamedTuple):
+    """Location and title snippet of a review comment already on a PR."""
+
+    path: str
+    line: int
+    snippet: str
 
 
 def get_app_version() -> str:
@@ -171,6 +180,13 @@ class CommentPoster:
             )
             print(f"Found {len(existing_locations)} existing comment locations")
 
+        # Index existing comments by path so each issue only scans its own file
+        existing_by_path: Dict[str, List] = {}
+        for existing_path, existing_line, existing_title in existing_locations:
+            existing_by_path.setdefault(existing_path, []).append(
+                (existing_line, existing_title)
+            )
+
         # Build review comments with enhanced deduplication
         comments = []
         seen_locations = set()
@@ -186,16 +202,17 @@ class CommentPoster:
                 # Check if similar comment already exists
                 # Match by location AND title to handle anchor-based duplicates
                 is_duplicate = False
-                for existing_path, existing_line, existing_title in existing_locations:
-                    if existing_path == comment["path"]:
-                        # Check if line numbers are close (within 5 lines) and titles match
-                        line_distance = abs(existing_line - comment["line"])
-                        if line_distance <= 5 and existing_title == issue_title:
-                            print(
-                                f"Skipping existing comment at {comment['path']}:{comment['line']} (similar to {existing_line})"
-                            )
-                            is_duplicate = True
-                            break
+                for existing_line, existing_title in existing_by_path.get(
+                    comment["path"], ()
+                ):
+                    # Check if line numbers are close (within 5 lines) and titles match
+                    line_distance = abs(existing_line - comment["line"])
+                    if line_distance <= 5 and existing_title == issue_title:
+                        print(
+                            f"Skipping existing comment at {comment['path']}:{comment['line']} (similar to {existing_line})"
+                        )
+                        is_duplicate = True
+                        break
 
                 if is_duplicate:
                     continue
@@ -622,7 +639,8 @@ class CommentPoster:
         Uses comment body snippet to detect duplicates even if line number changes slightly.
 
         Returns:
-            Set of (file_path, line, body_snippet) tuples for existing comments
+            Set of ExistingCommentLocation (file_path, line, body_snippet)
+            tuples for existing comments
         """
         url = f"{self.github_api_url}/repos/{repo_owner}/{repo_name}/pulls/{pr_number}/comments"
 
@@ -658,7 +676,9 @@ class CommentPoster:
 
                 if path and line:
                     # Store with body snippet for anchor-based matching
-                    locations.add((path, line, body_snippet))
+                    locations.add(
+                        ExistingCommentLocation(sys.intern(path), line, body_snippet)
+                    )
 
             return locations
 
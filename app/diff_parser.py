@@ -16,6 +16,13 @@ from app.constants import WEB_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
+# Hunk header: @@ -old_start,old_count +new_start,new_count @@
+# Group 1 is new_start, group 2 the (optional) new_count
+HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# "b/" path in a "diff --git a/old b/new" header, stopping at whitespace
+DIFF_GIT_PATH_RE = re.compile(r"\sb/(\S+)")
+
 
 class DiffParser:
     """Parses unified diffs and provides line mapping utilities."""
@@ -69,7 +76,7 @@ class DiffParser:
                 # Match "b/" followed by path, stopping at whitespace to avoid line-bleed
                 # Regex uses \s before b/ to skip "a/" paths and match only the second "b/"
                 # This correctly handles renames: "diff --git a/old.txt b/new.txt"
-                match = re.search(r"\sb/(\S+)", line)
+                match = DIFF_GIT_PATH_RE.search(line)
                 if match:
                     current_file = match.group(1)
                     current_diff_lines = [line]
@@ -86,7 +93,80 @@ class DiffParser:
         return file_diffs
 
     @staticmethod
-    def filter_diff_for_files(full_diff: str, file_paths: List[str]) -> str:
+    def match_diff_path(
+        file_path: str, parsed: Dict[str, str], debug: bool = False
+    ) -> Optional[str]:
+        """
+        Find the diff path in a parsed diff that corresponds to a requested file.
+
+        Tries an exact match first, then an unambiguous suffix match (handles
+        different leading directory components), then a unique basename match.
+
+        Args:
+            file_path: Requested file path
+            parsed: Per-file diff sections as returned by parse_diff
+            debug: Whether to log DEBUG_WEB_REVIEW matching details
+
+        Returns:
+            Matching key of parsed, or None if no unambiguous match exists
+        """
+        # 1. Try exact match first
+        if file_path in parsed:
+            if debug:
+                logger.info(f"  [{file_path}] Exact match found")
+            return file_path
+
+        # 2. Try suffix matching (handles different leading directory components)
+        # Only use suffix match if it's unambiguous (exactly one match)
+        suffix_matches = []
+        for diff_path in parsed:
+            # Check if either path is a suffix of the other
+            if diff_path.endswith("/" + file_path) or file_path.endswith(
+                "/" + diff_path
+            ):
+                suffix_matches.append(diff_path)
+            # Also check without leading slash for edge cases
+            elif diff_path.endswith(file_path) or file_path.endswith(diff_path):
+                # But only if they differ in directory components
+                if "/" in file_path or "/" in diff_path:
+                    suffix_matches.append(diff_path)
+
+        if len(suffix_matches) == 1:
+            if debug:
+                logger.info(f"  [{file_path}] Suffix match: {suffix_matches[0]}")
+            return suffix_matches[0]
+        if len(suffix_matches) > 1:
+            if debug:
+                logger.info(
+                    f"  [{file_path}] Multiple suffix matches, skipping: {suffix_matches}"
+                )
+            return None
+
+        # 3. Last resort: basename matching (only if unique)
+        file_basename = os.path.basename(file_path)
+        basename_matches = [
+            dp for dp in parsed if os.path.basename(dp) == file_basename
+        ]
+
+        if len(basename_matches) == 1:
+            if debug:
+                logger.info(f"  [{file_path}] Basename match: {basename_matches[0]}")
+            return basename_matches[0]
+        if debug:
+            if basename_matches:
+                logger.info(
+                    f"  [{file_path}] Ambiguous basename matches: {basename_matches}"
+                )
+            else:
+                logger.info(f"  [{file_path}] No match found")
+        return None
+
+    @staticmethod
+    def filter_diff_for_files(
+        full_diff: str,
+        file_paths: List[str],
+        parsed: Optional[Dict[str, str]] = None,
+    ) -> str:
         """
         Filter diff to only include specified files.
 
@@ -96,6 +176,8 @@ class DiffParser:
         Args:
             full_diff: Full unified diff text
             file_paths: List of file paths to include
+            parsed: Optional per-file sections of full_diff from parse_diff,
+                so callers filtering one diff repeatedly can parse it once
 
         Returns:
             Filtered diff containing only specified files
@@ -113,7 +195,8 @@ class DiffParser:
         ]
 
         file_set = set(file_paths)
-        parsed = DiffParser.parse_diff(full_diff)
+        if parsed is None:
+            parsed = DiffParser.parse_diff(full_diff)
         diff_paths = list(parsed.keys())
 
         # DEBUG_WEB_REVIEW: Log path matching details
@@ -125,62 +208,9 @@ class DiffParser:
         # Collect diffs for requested files
         filtered_sections = []
         for file_path in file_paths:
-            matched_diff_path = None
-
-            # 1. Try exact match first
-            if file_path in parsed:
-                matched_diff_path = file_path
-                if debug_web_review:
-                    logger.info(f"  [{file_path}] Exact match found")
-            else:
-                # 2. Try suffix matching (handles different leading directory components)
-                # Only use suffix match if it's unambiguous (exactly one match)
-                suffix_matches = []
-                for diff_path in diff_paths:
-                    # Check if either path is a suffix of the other
-                    if diff_path.endswith("/" + file_path) or file_path.endswith(
-                        "/" + diff_path
-                    ):
-                        suffix_matches.append(diff_path)
-                    # Also check without leading slash for edge cases
-                    elif diff_path.endswith(file_path) or file_path.endswith(diff_path):
-                        # But only if they differ in directory components
-                        if "/" in file_path or "/" in diff_path:
-                            suffix_matches.append(diff_path)
-
-                if len(suffix_matches) == 1:
-                    matched_diff_path = suffix_matches[0]
-                    if debug_web_review:
-                        logger.info(
-                            f"  [{file_path}] Suffix match: {matched_diff_path}"
-                        )
-                elif len(suffix_matches) > 1:
-                    if debug_web_review:
-                        logger.info(
-                            f"  [{file_path}] Multiple suffix matches, skipping: {suffix_matches}"
-                        )
-                else:
-                    # 3. Last resort: basename matching (only if unique)
-                    file_basename = os.path.basename(file_path)
-                    basename_matches = [
-                        dp for dp in diff_paths if os.path.basename(dp) == file_basename
-                    ]
-
-                    if len(basename_matches) == 1:
-                        matched_diff_path = basename_matches[0]
-                        if debug_web_review:
-                            logger.info(
-                                f"  [{file_path}] Basename match: {matched_diff_path}"
-                            )
-                    elif len(basename_matches) > 1:
-                        if debug_web_review:
-                            logger.info(
-                                f"  [{file_path}] Ambiguous basename matches: {basename_matches}"
-                            )
-                    else:
-                        if debug_web_review:
-                            logger.info(f"  [{file_path}] No match found")
-
+            matched_diff_path = DiffParser.match_diff_path(
+                file_path, parsed, debug=debug_web_review
+            )
             if matched_diff_path:
                 filtered_sections.append(parsed[matched_diff_path])
 
@@ -256,7 +286,7 @@ class DiffParser:
                 continue
 
             # Match hunk header: @@ -old_start,old_count +new_start,new_count @@
-            hunk_match = re.match(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@", line)
+            hunk_match = HUNK_HEADER_RE.match(line) if line.startswith("@@") else None
             if hunk_match and current_file:
                 current_line = int(hunk_match.group(1))
                 in_hunk = True
@@ -264,20 +294,22 @@ class DiffParser:
 
             # Process lines in hunk
             if in_hunk and current_file:
-                if line.startswith("+") and not line.startswith("+++"):
+                # Classify by first character; only '+' needs a longer check
+                first = line[:1]
+                if first == "+" and not line.startswith("+++"):
                     # Added line - commentable
                     commentable[current_file].append(current_line)
                     current_line += 1
-                elif line.startswith(" "):
+                elif first == " ":
                     # Context line - also commentable
                     commentable[current_file].append(current_line)
                     current_line += 1
-                elif line.startswith("-"):
+                elif first == "-":
                     # Removed line - don't increment new file line number
                     pass
                 else:
                     # Empty or other line - might be end of hunk
-                    if line and not line.startswith("\\"):
+                    if first and first != "\\":
                         in_hunk = False
 
         return commentable
@@ -312,7 +344,7 @@ class DiffParser:
                 continue
 
             # Match hunk header
-            hunk_match = re.match(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", line)
+            hunk_match = HUNK_HEADER_RE.match(line) if line.startswith("@@") else None
             if hunk_match and current_file:
                 start = int(hunk_match.group(1))
                 count = int(hunk_match.group(2)) if hunk_match.group(2) else 1
@@ -395,7 +427,7 @@ class DiffParser:
                 continue
 
             # Match hunk header
-            hunk_match = re.match(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@", line)
+            hunk_match = HUNK_HEADER_RE.match(line) if line.startswith("@@") else None
             if hunk_match and current_file == file_path:
                 current_line = int(hunk_match.group(1))
                 in_hunk = True
@@ -404,13 +436,14 @@ class DiffParser:
 
             # Collect lines in hunk for target file
             if in_hunk and current_file == file_path:
-                if line.startswith("+") and not line.startswith("+++"):
+                first = line[:1]
+                if first == "+" and not line.startswith("+++"):
                     lines_buffer.append((current_line, line[1:]))  # Remove '+'
                     current_line += 1
-                elif line.startswith(" "):
+                elif first == " ":
                     lines_buffer.append((current_line, line[1:]))  # Remove ' '
                     current_line += 1
-                elif line.startswith("-"):
+                elif first == "-":
                     # Skip removed lines
                     pass
 
@@ -471,6 +504,7 @@ def validate_issues_in_batch(
     batch_files: List[str],
     commentable_lines: Dict[str, List[int]],
     diff_text: Optional[str] = None,
+    line_texts: Optional[Dict[str, Dict[int, str]]] = None,
 ) -> List[Dict]:
     """
     Validate and adjust issues to ensure they're in the batch and on commentable lines.
@@ -483,6 +517,8 @@ def validate_issues_in_batch(
         batch_files: List of files in current batch
         commentable_lines: Dict of file -> commentable line numbers
         diff_text: Optional unified diff text for anchor resolution
+        line_texts: Optional precomputed line texts for diff_text (e.g. from
+            SemanticAnchorResolver.parse_diff); extracted from the diff if omitted
 
     Returns:
         List of validated issues (may be adjusted or filtered)
@@ -504,11 +540,13 @@ def validate_issues_in_batch(
     drop_reasons = []
 
     # Extract line texts for anchor resolution if diff provided
-    line_texts = {}
-    if diff_text:
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            diff_text, commentable_lines
-        )
+    if not diff_text:
+        line_texts = {}
+    else:
+        if line_texts is None:
+            line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
+                diff_text, commentable_lines
+            )
 
         # DEBUG_WEB_REVIEW: Log right_line_to_text counts
         if debug_web_review:
@@ -518,6 +556,32 @@ def validate_issues_in_batch(
                     f"  {file_path}: {len(line_to_text)} commentable lines with text"
                 )
 
+    # Files with several issues on non-commentable lines are anchored in one
+    # shared line scan per file; single issues (and debug runs, which log
+    # per-issue resolution) use resolve_anchor_line in the loop below
+    batch_anchors = {}  # id(issue) -> (resolved_line, matched_text)
+    if line_texts and not debug_enabled:
+        pending: Dict[str, List[Dict]] = {}
+        for issue in issues:
+            file_path = issue.get("file", "")
+            line = issue.get("line", 0)
+            if (
+                file_path in batch_file_set
+                and file_path in line_texts
+                and line > 0
+                and line not in commentable_lines.get(file_path, ())
+            ):
+                pending.setdefault(file_path, []).append(issue)
+
+        for file_path, file_issues in pending.items():
+            if len(file_issues) < 2:
+                continue
+            resolved = SemanticAnchorResolver.resolve_anchor_lines(
+                file_issues, line_texts[file_path], Path(file_path).suffix
+            )
+            for issue, anchor in zip(file_issues, resolved):
+                batch_anchors[id(issue)] = anchor
+
     for issue in issues:
         file_path = issue.get("file", "")
         line = issue.get("line", 0)
@@ -630,16 +694,19 @@ def validate_issues_in_batch(
                                 f"  Extracted call-site token: {call_site_from_current}"
                             )
 
-                    # Use new deterministic resolve_anchor_line function
-                    resolved_line, matched_text = (
-                        SemanticAnchorResolver.resolve_anchor_line(
-                            issue=issue,
-                            right_line_to_text=right_line_to_text,
-                            fallback_line=line,
-                            file_extension=file_ext,
-                            debug=debug_enabled,
+                    if id(issue) in batch_anchors:
+                        resolved_line, matched_text = batch_anchors[id(issue)]
+                    else:
+                        # Use new deterministic resolve_anchor_line function
+                        resolved_line, matched_text = (
+                            SemanticAnchorResolver.resolve_anchor_line(
+                                issue=issue,
+                                right_line_to_text=right_line_to_text,
+                                fallback_line=line,
+                                file_extension=file_ext,
+                                debug=debug_enabled,
+                            )
                         )
-                    )
 
                 if resolved_line:
                     if debug_enabled:
@@ -6,22 +6,97 @@ for phased reviews.
 """
 
 import re
+import sys
 import logging
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from app.diff_parser import DiffParser
 
 logger = logging.getLogger(__name__)
 
 
-# Platform detection order (strict)
-PLATFORM_ORDER = ["Android", "iOS", "Web", "React Native", "Flutter"]
+# Platform detection order (strict). Names are interned so bucket keys and
+# comparisons against them share a single string object.
+PLATFORM_ORDER = [
+    sys.intern(platform)
+    for platform in ("Android", "iOS", "Web", "React Native", "Flutter")
+]
+
+# Extensions whose platform is known without looking at content
+EXTENSION_PLATFORMS = {
+    ".kt": "Android",
+    ".java": "Android",
+    ".swift": "iOS",
+    ".m": "iOS",
+    ".mm": "iOS",
+    ".dart": "Flutter",
+    ".css": "Web",
+    ".html": "Web",
+}
+
+# Extensions that need content-based Web vs React Native detection
+JS_TS_EXTENSIONS = {".tsx", ".jsx", ".ts", ".js"}
+_JS_TS_SUFFIXES = tuple(JS_TS_EXTENSIONS)
+
+# Translation table mapping Windows path separators to forward slashes
+_PATH_SEPARATOR_TABLE = str.maketrans("\\", "/")
+
+# Keys checked (in order) for the file path of dict location entries
+PATH_KEYS = ("path", "file", "file_path")
 
 # Minimum length for a valid file path (e.g., "a/b" is 3 chars)
 MIN_PATH_LENGTH = 2
 
 
+# React Native signals in a single pass: imports from 'react-native' or
+# common RN component tags in JSX/TSX
+RN_SIGNAL_RE = re.compile(
+    r"(?P<import>from\s+['\"]react-native['\"]"
+    r"|require\s*\(['\"]react-native['\"]\))"
+    r"|(?P<component><(?:View|Text|TouchableOpacity|ScrollView|FlatList|Image"
+    r"|TextInput|SafeAreaView|Pressable)[\s>])",
+    re.ASCII,
+)
+
+# Literal substrings, at least one of which must occur for RN_SIGNAL_RE to
+# match. Plain substring search is much cheaper than the regex, so diffs
+# without any of them never reach it.
+RN_SIGNAL_NEEDLES = (
+    "react-native",
+    "<View",
+    "<Text",
+    "<TouchableOpacity",
+    "<ScrollView",
+    "<FlatList",
+    "<Image",
+    "<SafeAreaView",
+    "<Pressable",
+)
+
+
+def _has_react_native_signal(file_path: str, file_diff: str) -> bool:
+    """
+    Check a single file's diff section for React Native signals.
+
+    Args:
+        file_path: Path to the file (for logging)
+        file_diff: Diff section for the file
+
+    Returns:
+        True if the diff contains an RN import or component tag
+    """
+    if not any(needle in file_diff for needle in RN_SIGNAL_NEEDLES):
+        return False
+
+    match = RN_SIGNAL_RE.search(file_diff)
+    if not match:
+        return False
+
+    logger.debug(f"Detected React Native {match.lastgroup} in {file_path}")
+    return True
+
+
 def detect_react_native_in_diff(file_path: str, pr_diff: str) -> bool:
     """
     Detect if a file is React Native by analyzing its diff content.
@@ -37,42 +112,55 @@ def detect_react_native_in_diff(file_path: str, pr_diff: str) -> bool:
     Returns:
         True if file is detected as React Native
     """
+    # Only JS/TS files can be React Native; don't touch the diff otherwise
+    if not file_path.lower().endswith(_JS_TS_SUFFIXES):
+        return False
+
+    if not pr_diff:
+        return False
+
     # Get the diff chunk for this specific file
     file_diff = DiffParser.filter_diff_for_files(pr_diff, [file_path])
     if not file_diff:
         return False
 
-    # Check for React Native imports
-    rn_import_patterns = [
-        r"from\s+['\"]react-native['\"]",
-        r"require\s*\(['\"]react-native['\"]\)",
-    ]
-
-    for pattern in rn_import_patterns:
-        if re.search(pattern, file_diff):
-            logger.debug(f"Detected React Native import in {file_path}")
-            return True
-
-    # Check for React Native component tags
-    # Look for common RN components in JSX/TSX
-    rn_components = [
-        r"<View[\s>]",
-        r"<Text[\s>]",
-        r"<TouchableOpacity[\s>]",
-        r"<ScrollView[\s>]",
-        r"<FlatList[\s>]",
-        r"<Image[\s>]",
-        r"<TextInput[\s>]",
-        r"<SafeAreaView[\s>]",
-        r"<Pressable[\s>]",
-    ]
-
-    for component_pattern in rn_components:
-        if re.search(component_pattern, file_diff):
-            logger.debug(f"Detected React Native component in {file_path}")
-            return True
-
-    return False
+    return _has_react_native_signal(file_path, file_diff)
+
+
+def detect_react_native_files(file_paths: List[str], pr_diff: str) -> Set[str]:
+    """
+    Detect which of several files are React Native, parsing the diff once.
+
+    Equivalent to calling detect_react_native_in_diff for each file, but the
+    diff is split into per-file sections a single time and each section is
+    scanned at most once.
+
+    Args:
+        file_paths: Paths of the files to check
+        pr_diff: Full PR diff
+
+    Returns:
+        Set of file paths detected as React Native
+    """
+    if not file_paths or not pr_diff:
+        return set()
+
+    parsed = DiffParser.parse_diff(pr_diff)
+    section_is_rn: Dict[str, bool] = {}
+    rn_files: Set[str] = set()
+
+    for file_path in file_paths:
+        diff_path = DiffParser.match_diff_path(file_path, parsed)
+        if not diff_path:
+            continue
+        if diff_path not in section_is_rn:
+            section_is_rn[diff_path] = _has_react_native_signal(
+                file_path, parsed[diff_path]
+            )
+        if section_is_rn[diff_path]:
+            rn_files.add(file_path)
+
+    return rn_files
 
 
 def bucket_files_by_platform(
@@ -95,40 +183,30 @@ def bucket_files_by_platform(
     Returns:
         Dict mapping platform name to list of files
     """
-    buckets: Dict[str, List[str]] = {
-        "Android": [],
-        "iOS": [],
-        "Web": [],
-        "React Native": [],
-        "Flutter": [],
-    }
+    buckets: Dict[str, List[str]] = {platform: [] for platform in PLATFORM_ORDER}
 
-    for file_path in changed_files:
-        ext = Path(file_path).suffix.lower()
+    # Extensions are case-folded once; paths themselves keep their case
+    extensions = [Path(file_path).suffix.lower() for file_path in changed_files]
 
-        # Android
-        if ext in [".kt", ".java"]:
-            buckets["Android"].append(file_path)
+    # Content-based detection for JS/TS files is done in a single diff pass
+    rn_files = detect_react_native_files(
+        [
+            file_path
+            for file_path, ext in zip(changed_files, extensions)
+            if ext in JS_TS_EXTENSIONS
+        ],
+        pr_diff,
+    )
 
-        # iOS
-        elif ext in [".swift", ".m", ".mm"]:
-            buckets["iOS"].append(file_path)
-
-        # Flutter
-        elif ext == ".dart":
-            buckets["Flutter"].append(file_path)
-
-        # Web unconditional
-        elif ext in [".css", ".html"]:
-            buckets["Web"].append(file_path)
+    for file_path, ext in zip(changed_files, extensions):
+        platform = EXTENSION_PLATFORMS.get(ext)
 
         # Web-ish: requires content-based detection
-        elif ext in [".tsx", ".jsx", ".ts", ".js"]:
-            if detect_react_native_in_diff(file_path, pr_diff):
-                buckets["React Native"].append(file_path)
-            else:
-                buckets["Web"].append(file_path)
+        if ext in JS_TS_EXTENSIONS:
+            platform = "React Native" if file_path in rn_files else "Web"
 
+        if platform:
+            buckets[platform].append(file_path)
         else:
             # Unknown extension, skip
             logger.debug(f"Skipping file with unknown extension: {file_path}")
@@ -160,7 +238,8 @@ def normalize_path(path: str) -> str:
 
     - Converts backslashes to forward slashes
     - Strips leading slash
-    - Returns lowercase for case-insensitive comparison
+
+    Case is preserved, since repository paths are case-sensitive.
 
     Args:
         path: File path to normalize
@@ -172,7 +251,7 @@ def normalize_path(path: str) -> str:
         return ""
 
     # Convert backslashes to forward slashes
-    normalized = path.replace("\\", "/")
+    normalized = path.translate(_PATH_SEPARATOR_TABLE)
 
     # Strip leading slash
     if normalized.startswith("/"):
@@ -181,6 +260,23 @@ def normalize_path(path: str) -> str:
     return normalized
 
 
+def _first_path_value(entry: Dict):
+    """
+    Return the first truthy value among the known path keys of a dict entry.
+
+    Args:
+        entry: Location dict
+
+    Returns:
+        Path value, or None if no path key is set
+    """
+    for key in PATH_KEYS:
+        value = entry.get(key)
+        if value:
+            return value
+    return None
+
+
 def extract_path_from_entry(entry) -> str:
     """
     Extract file path from various entry formats.
@@ -222,25 +318,19 @@ def extract_path_from_entry(entry) -> str:
         return str(entry[0])
     
     elif isinstance(entry, dict):
-        # Try multiple key names
-        path = entry.get("path") or entry.get("file") or entry.get("file_path")
-
-        # If not found at top level, try nested comment object
-        if not path and "comment" in entry:
-            comment = entry["comment"]
+        # Try top-level keys, then the nested comment object
+        path = _first_path_value(entry)
+        if not path:
+            comment = entry.get("comment")
             if isinstance(comment, dict):
-                path = (
-                    comment.get("path")
-                    or comment.get("file")
-                    or comment.get("file_path")
-                )
+                path = _first_path_value(comment)
 
         return str(path) if path else ""
 
     return ""
 
 
-def filter_locations_for_files(locations: List, file_paths: List[str]) -> List:
+def filter_locations_for_files(locations: Iterable, file_paths: List[str]) -> List:
     """
     Filter a list of locations (comments/threads) to only include those
     matching the given file paths.
@@ -255,24 +345,85 @@ def filter_locations_for_files(locations: List, file_paths: List[str]) -> List:
     - Leading slashes stripped
 
     Args:
-        locations: List of location entries (tuples or dicts)
+        locations: Iterable of location entries (tuples or dicts). Sets and
+            generators are accepted directly and iterated once; the input is
+            never modified.
         file_paths: List of file paths to include
 
     Returns:
-        Filtered list of locations
+        Filtered list of locations. Matching entries are the original objects
+        from locations, not copies.
     """
-    if not locations:
+    if not locations or not file_paths:
         return []
 
-    # Normalize file paths for comparison
-    normalized_file_set = {normalize_path(f) for f in file_paths}
+    # Normalize file paths for comparison. Matching is exact, so a hash set
+    # beats a sorted list + bisect even for very large monorepo file lists.
+    normalized_file_set = {sys.intern(normalize_path(f)) for f in file_paths}
     filtered = []
 
+    # Many comments share a file, so each distinct raw path is normalized
+    # and looked up only once
+    path_matches: Dict[str, bool] = {}
+
     for entry in locations:
         file_path = extract_path_from_entry(entry)
-        normalized_path = normalize_path(file_path)
+        matches = path_matches.get(file_path)
+        if matches is None:
+            normalized_path = sys.intern(normalize_path(file_path))
+            matches = bool(normalized_path) and normalized_path in normalized_file_set
+            path_matches[file_path] = matches
 
-        if normalized_path and normalized_path in normalized_file_set:
+        if matches:
             filtered.append(entry)
 
     return filtered
+
+
+def bucket_locations_by_platform(
+    locations: Iterable, platform_buckets: Dict[str, List[str]]
+) -> Dict[str, List]:
+    """
+    Split locations (comments/threads) by the platform of their file.
+
+    Equivalent to calling filter_locations_for_files once per platform, but
+    walks locations a single time so phased reviews don't rescan every
+    existing comment for each phase.
+
+    Args:
+        locations: Iterable of location entries (tuples or dicts)
+        platform_buckets: Dict mapping platform name to list of files, as
+            returned by bucket_files_by_platform
+
+    Returns:
+        Dict mapping each platform in platform_buckets to its matching
+        location entries (original objects, in input order)
+    """
+    located: Dict[str, List] = {platform: [] for platform in platform_buckets}
+    if not locations:
+        return located
+
+    platform_by_path: Dict[str, str] = {}
+    for platform, files in platform_buckets.items():
+        for file_path in files:
+            normalized = sys.intern(normalize_path(file_path))
+            if normalized:
+                platform_by_path.setdefault(normalized, platform)
+
+    if not platform_by_path:
+        return located
+
+    # Raw path -> platform (or None), so repeated paths skip normalization
+    platform_by_raw_path: Dict[str, Optional[str]] = {}
+
+    for entry in locations:
+        file_path = extract_path_from_entry(entry)
+        if file_path in platform_by_raw_path:
+            platform = platform_by_raw_path[file_path]
+        else:
+            platform = platform_by_path.get(sys.intern(normalize_path(file_path)))
+            platform_by_raw_path[file_path] = platform
+        if platform:
+            located[platform].append(entry)
+
+    return located
@@ -24,9 +24,13 @@ from app.diff_parser import (
     is_no_issues_placeholder,
     _is_web_file,
 )
+from app.semantic_anchor_resolver import SemanticAnchorResolver
 
 logger = logging.getLogger(__name__)
 
+# Severity values an issue may carry; anything else is coerced to "minor"
+ALLOWED_SEVERITIES = frozenset(("info", "minor", "major", "critical"))
+
 
 class PRReviewer:
     """Reviews PRs for accessibility issues using Scout AI."""
@@ -112,6 +116,9 @@ class PRReviewer:
         else:
             web_extensions = set()
 
+        # Split the PR diff into per-file sections once for all batches
+        parsed_pr_diff = DiffParser.parse_diff(pr_diff)
+
         for batch_idx, file_batch in enumerate(batches):
             # DEBUG_WEB_REVIEW: Log batch BEGIN
             if debug_web_review:
@@ -123,7 +130,9 @@ class PRReviewer:
                 )
 
             # Get diff for this batch using proper diff parser
-            batch_diff = DiffParser.filter_diff_for_files(pr_diff, file_batch)
+            batch_diff = DiffParser.filter_diff_for_files(
+                pr_diff, file_batch, parsed=parsed_pr_diff
+            )
             if not batch_diff:
                 # DEBUG_WEB_REVIEW: Enhanced diagnostics when batch is skipped
                 if debug_web_review:
@@ -156,8 +165,10 @@ class PRReviewer:
                     + "\n\n# [TRUNCATED] Diff exceeded max characters.\n"
                 )
 
-            # Extract commentable lines for validation
-            commentable_lines = DiffParser.extract_commentable_lines(batch_diff)
+            # Extract commentable lines (and their texts, reused for anchor
+            # resolution during validation) in one parse
+            parsed_diff = SemanticAnchorResolver.parse_diff(batch_diff)
+            commentable_lines = parsed_diff.commentable
 
             # DEBUG_WEB_REVIEW: Log batch composition and commentable lines
             if debug_web_review:
@@ -286,6 +297,7 @@ class PRReviewer:
                 file_batch,
                 commentable_lines,
                 batch_diff,
+                line_texts=parsed_diff.texts,
             )
 
             # DEBUG_WEB_REVIEW: Log summary after validation
@@ -378,18 +390,21 @@ class PRReviewer:
         review_threads: Optional[List[Dict]] = None,
     ) -> str:
         """Create review prompt for Scout AI."""
-        files_list = "\n".join([f"- {f}" for f in files_in_batch])
         platforms_list = ", ".join(platforms) if platforms else "Unknown"
 
+        # The prompt is accumulated as a list of lines and joined exactly once
         parts = [
             "You are performing an automated accessibility review on a GitHub Pull Request.",
             "",
             "# PR Information",
             f"Platforms detected: {platforms_list}",
             f"Files in this batch: {len(files_in_batch)}",
-            files_list,
-            "",
         ]
+        if files_in_batch:
+            parts.extend(f"- {f}" for f in files_in_batch)
+        else:
+            parts.append("")
+        parts.append("")
 
         # Add existing comments section if provided
         if existing_comments:
@@ -400,27 +415,11 @@ class PRReviewer:
                     "",
                 ]
             )
-            for entry in existing_comments:
-                # Handle different entry shapes for backward compatibility
-                file_path = None
-                line_num = None
-
-                if isinstance(entry, dict):
-                    # Dict entry: {'file': ..., 'line': ...} or {'path': ..., 'line': ...}
-                    file_path = entry.get("file") or entry.get("path")
-                    line_num = entry.get("line")
-                elif isinstance(entry, (list, tuple)):
-                    # Tuple/list entry: (file_path, line_num, ...) - use first two
-                    if len(entry) >= 2:
-                        file_path = entry[0]
-                        line_num = entry[1]
-                else:
-                    # Unsupported shape - skip gracefully
-                    continue
-
-                # Only add if we have both values (explicit None checks to handle line 0)
-                if file_path is not None and line_num is not None:
-                    parts.append(f"- {file_path}:{line_num}")
+            rendered = self._render_existing_comments(
+                self._existing_comment_locations(existing_comments)
+            )
+            if rendered:
+                parts.append(rendered)
 
             parts.extend(
                 [
@@ -656,14 +655,10 @@ class PRReviewer:
         
         # Handle severity field with normalization
         severity = normalized.get("severity", "")
-        if not severity or severity is None:
-            severity = "minor"
-        else:
-            severity = str(severity).lower()
-        
+        severity = str(severity).lower() if severity else "minor"
+
         # Validate severity and coerce to allowed values
-        allowed_severities = ["info", "minor", "major", "critical"]
-        if severity not in allowed_severities:
+        if severity not in ALLOWED_SEVERITIES:
             logger.debug(f"Unknown severity value '{severity}', coercing to 'minor'")
             severity = "minor"
         
@@ -812,6 +807,59 @@ class PRReviewer:
         # Hash for consistent length
         return hashlib.md5(fingerprint_str.encode()).hexdigest()
 
+    @staticmethod
+    def _existing_comment_locations(
+        existing_comments: List,
+    ) -> Tuple[Tuple[str, str], ...]:
+        """
+        Normalize existing comment entries into (file, line) pairs.
+
+        Supports (file, line, ...) sequences such as tuples and lists (but
+        not strings) and {'file'|'path', 'line'} dicts. Malformed entries
+        are skipped.
+
+        Args:
+            existing_comments: Existing comment entries of mixed shapes
+
+        Returns:
+            Tuple of (file, line) string pairs
+        """
+        locations = []
+        for entry in existing_comments:
+            # Destructure and validate each supported shape in one step
+            match entry:
+                case dict():
+                    # {'file': ..., 'line': ...} or {'path': ..., 'line': ...}
+                    file_path = entry.get("file") or entry.get("path")
+                    line_num = entry.get("line")
+                case [file_path, line_num, *_]:
+                    # (file_path, line_num, ...) - use first two
+                    pass
+                case _:
+                    # Unsupported shape or too few elements - skip gracefully
+                    continue
+
+            # Only add if we have both values (explicit None checks to handle line 0)
+            if file_path is not None and line_num is not None:
+                locations.append((f"{file_path}", f"{line_num}"))
+
+        return tuple(locations)
+
+    @staticmethod
+    def _render_existing_comments(locations: Tuple[Tuple[str, str], ...]) -> str:
+        """
+        Render existing comment locations as prompt bullet lines.
+
+        Args:
+            locations: (file, line) pairs from _existing_comment_locations
+
+        Returns:
+            Newline-joined "- file:line" bullets
+        """
+        return "\n".join(
+            f"- {file_path}:{line_num}" for file_path, line_num in locations
+        )
+
     @staticmethod
     def _clamp_lines(text: str, max_lines: int) -> str:
         """Clamp text to max lines."""
@@ -12,6 +12,13 @@ from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Optional: orjson serializes large reports much faster, but the stdlib
+    # encoder produces equivalent output
+    orjson = None
+
 
 class SARIFGenerator:
     """Generates SARIF reports from accessibility issues."""
@@ -140,73 +147,81 @@ class SARIFGenerator:
         Returns:
             List of SARIF result objects
         """
-        results = []
+        return [SARIFGenerator._make_result(issue) for issue in issues]
 
-        for issue in issues:
-            # Extract fields
-            file_path = issue.get("file", "")
-            line = issue.get("line", 1)
-            severity = issue.get("severity", "minor")
-            wcag_sc = issue.get("wcag_sc", "")
-            wcag_level = issue.get("wcag_level", "")
-            title = issue.get("title", "Accessibility Issue")
-            description = issue.get("description", "")
-            impact = issue.get("impact", "")
-            suggested_fix = issue.get("suggested_fix", "")
-
-            # Build message
-            message_parts = []
-            if description:
-                message_parts.append(description)
-            if impact:
-                message_parts.append(f"Impact: {impact}")
-            if suggested_fix:
-                message_parts.append(f"Suggested fix: {suggested_fix}")
-
-            message_text = "\n\n".join(message_parts) if message_parts else title
-
-            # Determine rule ID
-            rule_id = SARIFGenerator._make_rule_id(wcag_sc) if wcag_sc else "accessibility-generic"
-
-            # Map severity
-            sarif_level = SARIFGenerator.SEVERITY_MAP.get(severity, "warning")
-
-            # Build result
-            result = {
-                "ruleId": rule_id,
-                "level": sarif_level,
-                "message": {
-                    "text": message_text
-                },
-                "locations": [
-                    {
-                        "physicalLocation": {
-                            "artifactLocation": {
-                                "uri": file_path,
-                            },
-                            "region": {
-                                "startLine": line,
-                            },
-                        }
+    @staticmethod
+    def _make_result(issue: Dict) -> Dict:
+        """
+        Build a single SARIF result from an accessibility issue.
+
+        Args:
+            issue: Accessibility issue
+
+        Returns:
+            SARIF result object
+        """
+        # Extract fields
+        file_path = issue.get("file", "")
+        line = issue.get("line", 1)
+        severity = issue.get("severity", "minor")
+        wcag_sc = issue.get("wcag_sc", "")
+        wcag_level = issue.get("wcag_level", "")
+        title = issue.get("title", "Accessibility Issue")
+        description = issue.get("description", "")
+        impact = issue.get("impact", "")
+        suggested_fix = issue.get("suggested_fix", "")
+
+        # Build message
+        message_parts = []
+        if description:
+            message_parts.append(description)
+        if impact:
+            message_parts.append(f"Impact: {impact}")
+        if suggested_fix:
+            message_parts.append(f"Suggested fix: {suggested_fix}")
+
+        message_text = "\n\n".join(message_parts) if message_parts else title
+
+        # Determine rule ID
+        rule_id = SARIFGenerator._make_rule_id(wcag_sc) if wcag_sc else "accessibility-generic"
+
+        # Map severity
+        sarif_level = SARIFGenerator.SEVERITY_MAP.get(severity, "warning")
+
+        # Build result
+        result = {
+            "ruleId": rule_id,
+            "level": sarif_level,
+            "message": {
+                "text": message_text
+            },
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {
+                            "uri": file_path,
+                        },
+                        "region": {
+                            "startLine": line,
+                        },
                     }
-                ],
-            }
-
-            # Add properties
-            properties = {
-                "severity": severity,
-                "title": title,
-            }
-            if wcag_sc:
-                properties["wcag_sc"] = wcag_sc
-            if wcag_level:
-                properties["wcag_level"] = wcag_level
+                }
+            ],
+        }
 
-            result["properties"] = properties
+        # Add properties
+        properties = {
+            "severity": severity,
+            "title": title,
+        }
+        if wcag_sc:
+            properties["wcag_sc"] = wcag_sc
+        if wcag_level:
+            properties["wcag_level"] = wcag_level
 
-            results.append(result)
+        result["properties"] = properties
 
-        return results
+        return result
 
     @staticmethod
     def _make_rule_id(wcag_sc: str) -> str:
@@ -228,6 +243,23 @@ class SARIFGenerator:
         cleaned = wcag_sc.replace(".", "-").replace(" ", "")
         return f"wcag-{cleaned}"
 
+    @staticmethod
+    def _serialize(sarif: Dict) -> bytes:
+        """
+        Serialize a SARIF report to indented UTF-8 JSON.
+
+        Prefers orjson and falls back to the stdlib json module.
+
+        Args:
+            sarif: SARIF report dict
+
+        Returns:
+            Encoded JSON document
+        """
+        if orjson is not None:
+            return orjson.dumps(sarif, option=orjson.OPT_INDENT_2)
+        return json.dumps(sarif, indent=2, ensure_ascii=False).encode("utf-8")
+
     @staticmethod
     def write_sarif_file(sarif: Dict, output_path: str) -> bool:
         """
@@ -244,8 +276,7 @@ class SARIFGenerator:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with output_file.open('w') as f:
-                json.dump(sarif, f, indent=2)
+            output_file.write_bytes(SARIFGenerator._serialize(sarif))
 
             print(f"✅ SARIF report written to: {output_path}")
             return True
@@ -15,9 +15,171 @@ Supports:
 
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Pattern, Tuple
 from pathlib import Path
 
+from app.diff_parser import HUNK_HEADER_RE, DiffParser
+
+
+# Substrings that mark an anchor candidate as a regex rather than literal text
+ANCHOR_REGEX_MARKERS = (r'\b', r'\s', r'\(', '[', '^', '$', '.', '*')
+ISSUE_LINE_REGEX_MARKERS = (r'\b', r'\s', r'\(', '[', '^', '$')
+
+# UI call-site patterns from current_code, each with the prefix/suffix used to
+# render the matched token:
+# - Function/constructor calls - any capitalized identifier followed by '('
+#   (catches UI components, custom components, and future components)
+# - XML/HTML tags - any capitalized tag
+# - UIKit classes (e.g., UIButton, UITextField)
+CALL_SITE_PATTERNS = (
+    (re.compile(r'\b([A-Z][a-zA-Z0-9]+)\s*\('), '', '('),
+    (re.compile(r'<([A-Z][a-zA-Z0-9]+)\b'), '<', ''),
+    (re.compile(r'\b(UI[A-Z][a-zA-Z0-9]*)\b'), '', '('),
+)
+
+# Capitalized UI element names mentioned in issue titles/descriptions
+ELEMENT_NAME_RE = re.compile(
+    r'\b([A-Z][a-z]+(?:Field|View|Button|Text|Icon|Slider|Switch|Toggle|Label))\b'
+)
+
+
+class ParsedDiff(NamedTuple):
+    """Commentable line numbers and their texts for one diff."""
+
+    commentable: Dict[str, List[int]]
+    texts: Dict[str, Dict[int, str]]
+
+
+class _PreparedCandidate(NamedTuple):
+    """An anchor candidate classified once as a compiled regex or a literal."""
+
+    candidate: str
+    priority: int
+    regex: Optional[Pattern]  # Case-insensitive pattern, None for literals
+    literal_lower: Optional[str]  # Lowercased literal, None for regexes
+
+
+@lru_cache(maxsize=512)
+def _compile_anchor_pattern(pattern: str, flags: int = 0) -> Optional[Pattern]:
+    """
+    Compile an anchor candidate pattern once and reuse it across lines/issues.
+
+    Framework and keyword patterns are a small fixed set, so after warm-up
+    every lookup is a cache hit.
+
+    Args:
+        pattern: Regex pattern string
+        flags: re flags to compile with
+
+    Returns:
+        Compiled pattern, or None if the pattern is not a valid regex
+    """
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
+def _build_line_prefilter(regex_sources: List[str]) -> Optional[Pattern]:
+    """
+    Combine candidate regexes into one case-insensitive alternation.
+
+    A single scan of each line with the combined pattern tells whether any
+    candidate can match, so lines without an anchor skip the per-candidate
+    loop. This is the stdlib stand-in for a multi-pattern (Aho-Corasick)
+    matcher; per-candidate order still decides which candidate wins.
+
+    Args:
+        regex_sources: Regex sources (literals already escaped)
+
+    Returns:
+        Compiled alternation, or None if it cannot be built
+    """
+    if not regex_sources:
+        return None
+    return _compile_anchor_pattern(
+        '|'.join(f'(?:{source})' for source in regex_sources), re.IGNORECASE
+    )
+
+
+def _prepare_candidates(
+    candidates: List[str], priorities: List[int]
+) -> List[_PreparedCandidate]:
+    """
+    Classify and compile each anchor candidate once, not once per line.
+
+    A case-insensitive regex match subsumes the case-sensitive one, so
+    regex candidates are compiled with re.IGNORECASE. Invalid regexes are
+    skipped.
+
+    Args:
+        candidates: Anchor candidate strings
+        priorities: Priority of each candidate, index-aligned
+
+    Returns:
+        Prepared candidates in input order
+    """
+    prepared = []
+    for candidate, priority in zip(candidates, priorities):
+        if any(marker in candidate for marker in ANCHOR_REGEX_MARKERS):
+            pattern = _compile_anchor_pattern(candidate, re.IGNORECASE)
+            if pattern is None:
+                # Invalid regex, skip
+                continue
+            prepared.append(_PreparedCandidate(candidate, priority, pattern, None))
+        else:
+            prepared.append(_PreparedCandidate(candidate, priority, None, candidate.lower()))
+    return prepared
+
+
+def _build_candidate_prefilter(prepared: List[_PreparedCandidate]) -> Optional[Pattern]:
+    """
+    Build the combined line prefilter for a set of prepared candidates.
+
+    Groups would be renumbered inside the alternation (breaking
+    backreferences), and non-ASCII literals can case-fold differently under
+    str.lower() than under re.IGNORECASE; no prefilter is built then.
+
+    Args:
+        prepared: Prepared candidates
+
+    Returns:
+        Compiled alternation, or None if lines must be checked unfiltered
+    """
+    prefilter_sources = []
+    for candidate, _, pattern, _ in prepared:
+        if pattern is not None and not pattern.groups:
+            prefilter_sources.append(candidate)
+        elif pattern is None and candidate.isascii():
+            prefilter_sources.append(re.escape(candidate))
+        else:
+            return None
+    return _build_line_prefilter(prefilter_sources)
+
+
+def _pick_nearest(match_lines: List[int], reference_line: int) -> int:
+    """
+    Find the match line closest to a reference line.
+
+    Only the two neighbours of reference_line in the sorted list can be
+    closest, so this is a single bisect rather than a scan over all matches.
+
+    Args:
+        match_lines: Non-empty list of matched line numbers, sorted ascending
+        reference_line: Line number to measure distance from
+
+    Returns:
+        Index into match_lines of the closest line (ties go to the earlier line)
+    """
+    idx = bisect_left(match_lines, reference_line)
+    if idx == len(match_lines) or (
+        idx > 0 and reference_line - match_lines[idx - 1] <= match_lines[idx] - reference_line
+    ):
+        idx -= 1
+    return idx
+
 
 class SemanticAnchorResolver:
     """Resolves issue line numbers to semantic UI element anchors."""
@@ -110,6 +272,25 @@ class SemanticAnchorResolver:
         'contentdescription': [r'android:contentDescription', r'contentDescription\s*='],
     }
 
+    # Framework patterns inferred from a (lowercased) file extension
+    EXTENSION_PATTERNS = {
+        **dict.fromkeys(('.kt', '.kts'), tuple(COMPOSE_PATTERNS)),
+        '.xml': tuple(ANDROID_XML_PATTERNS),
+        '.swift': tuple(SWIFTUI_PATTERNS + UIKIT_PATTERNS),
+        **dict.fromkeys(
+            ('.tsx', '.jsx', '.ts', '.js', '.html', '.css'), tuple(REACT_WEB_PATTERNS)
+        ),
+    }
+
+    # UI element patterns across all frameworks
+    ALL_FRAMEWORK_PATTERNS = tuple(
+        COMPOSE_PATTERNS +
+        ANDROID_XML_PATTERNS +
+        SWIFTUI_PATTERNS +
+        UIKIT_PATTERNS +
+        REACT_WEB_PATTERNS
+    )
+
     @staticmethod
     def extract_call_site_token(current_code: Optional[str]) -> Optional[str]:
         """
@@ -128,33 +309,39 @@ class SemanticAnchorResolver:
         if not current_code:
             return None
             
-        # Pattern to match UI element call-sites:
+        # Match UI element call-sites:
         # - Compose/Kotlin: OutlinedTextField(, Button(, TextField(, etc.
         # - SwiftUI: TextField(, Toggle(, Button(, etc.
         # - UIKit: UIButton, UITextField, etc.
         # - Web: <button, <input, etc.
-        patterns = [
-            # Function/constructor calls - match any capitalized identifier followed by '('
-            # This catches UI components, custom components, and future components
-            r'\b([A-Z][a-zA-Z0-9]+)\s*\(',
-            # XML/HTML tags - match any capitalized tag
-            r'<([A-Z][a-zA-Z0-9]+)\b',
-            # UIKit classes (e.g., UIButton, UITextField)
-            r'\b(UI[A-Z][a-zA-Z0-9]*)\b',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, current_code)
+        for pattern, prefix, suffix in CALL_SITE_PATTERNS:
+            match = pattern.search(current_code)
             if match:
-                token = match.group(1)
-                # Return with appropriate suffix
-                if '<' in pattern:
-                    return f'<{token}'
-                else:
-                    return f'{token}('
+                return f'{prefix}{match.group(1)}{suffix}'
         
         return None
 
+    @staticmethod
+    def parse_diff(diff_text: str) -> ParsedDiff:
+        """
+        Parse a diff into commentable lines and their texts in one call.
+
+        Review batches need both the commentable lines and their texts from
+        the same diff; returning them together lets the texts be passed
+        through instead of re-extracted.
+
+        Args:
+            diff_text: Unified diff text
+
+        Returns:
+            ParsedDiff of (commentable line numbers, line texts) per file
+        """
+        commentable = DiffParser.extract_commentable_lines(diff_text)
+        texts = SemanticAnchorResolver.extract_commentable_line_texts(
+            diff_text, commentable
+        )
+        return ParsedDiff(commentable, texts)
+
     @staticmethod
     def extract_commentable_line_texts(
         diff_text: str,
@@ -174,38 +361,43 @@ class SemanticAnchorResolver:
         current_file = None
         current_line = 0
         in_hunk = False
+        # Texts dict and commentable line set for the current file, or None
+        # when the file is not tracked; sets make each membership check O(1)
+        file_texts = None
+        file_lines = None
 
         for line in diff_text.split('\n'):
-            # Match file header: +++ b/path/to/file
-            if line.startswith('+++ b/'):
-                current_file = line[6:]  # Skip '+++ b/'
-                if current_file in commentable_lines:
-                    line_texts[current_file] = {}
-                in_hunk = False
-                continue
-
-            # Match hunk header: @@ -old_start,old_count +new_start,new_count @@
-            hunk_match = re.match(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@', line)
-            if hunk_match and current_file:
-                current_line = int(hunk_match.group(1))
-                in_hunk = True
-                continue
-
-            # Process lines in hunk
-            if in_hunk and current_file and current_file in commentable_lines:
-                if line.startswith('+') and not line.startswith('+++'):
+            # Dispatch on the first character so most lines cost one comparison
+            first = line[:1]
+
+            if first == '+':
+                # Match file header: +++ b/path/to/file
+                if line.startswith('+++ b/'):
+                    current_file = line[6:]  # Skip '+++ b/'
+                    if current_file in commentable_lines:
+                        file_texts = line_texts[current_file] = {}
+                        file_lines = set(commentable_lines[current_file])
+                    else:
+                        file_texts = None
+                    in_hunk = False
+                elif in_hunk and file_texts is not None and not line.startswith('+++'):
                     # Added line
-                    if current_line in commentable_lines[current_file]:
-                        line_texts[current_file][current_line] = line[1:]  # Remove '+'
+                    if current_line in file_lines:
+                        file_texts[current_line] = line[1:]  # Remove '+'
                     current_line += 1
-                elif line.startswith(' '):
+            elif first == ' ':
+                if in_hunk and file_texts is not None:
                     # Context line
-                    if current_line in commentable_lines[current_file]:
-                        line_texts[current_file][current_line] = line[1:]  # Remove ' '
+                    if current_line in file_lines:
+                        file_texts[current_line] = line[1:]  # Remove ' '
                     current_line += 1
-                elif line.startswith('-'):
-                    # Removed line - don't increment
-                    pass
+            elif first == '@' and current_file:
+                # Match hunk header: @@ -old_start,old_count +new_start,new_count @@
+                hunk_match = HUNK_HEADER_RE.match(line)
+                if hunk_match:
+                    current_line = int(hunk_match.group(1))
+                    in_hunk = True
+            # Removed lines ('-') and anything else don't advance the new-file line
 
         return line_texts
 
@@ -235,9 +427,9 @@ class SemanticAnchorResolver:
             candidates.append(str(explicit_anchor))
 
         # 2. Extract from title and description
-        title = issue.get('title', '').lower()
-        description = issue.get('description', '').lower()
-        combined_text = f"{title} {description}"
+        title = issue.get('title', '')
+        description = issue.get('description', '')
+        combined_text = f"{title.lower()} {description.lower()}"
 
         # Check for keyword matches
         for keyword, patterns in SemanticAnchorResolver.ISSUE_KEYWORD_PATTERNS.items():
@@ -246,8 +438,7 @@ class SemanticAnchorResolver:
 
         # 3. Extract specific element names from title/description
         # Look for capitalized UI element names (e.g., "Slider", "Button")
-        element_name_pattern = r'\b([A-Z][a-z]+(?:Field|View|Button|Text|Icon|Slider|Switch|Toggle|Label))\b'
-        for match in re.finditer(element_name_pattern, issue.get('title', '') + ' ' + issue.get('description', '')):
+        for match in ELEMENT_NAME_RE.finditer(f'{title} {description}'):
             element_name = match.group(1)
             candidates.append(element_name)  # Exact match
             candidates.append(f'{element_name}(')  # Function call
@@ -255,23 +446,57 @@ class SemanticAnchorResolver:
 
         # 4. Add framework-specific patterns based on file extension
         if file_extension:
-            ext = file_extension.lower()
-            # Compose/Kotlin
-            if ext in ['.kt', '.kts']:
-                candidates.extend(SemanticAnchorResolver.COMPOSE_PATTERNS)
-            # Android XML
-            elif ext == '.xml':
-                candidates.extend(SemanticAnchorResolver.ANDROID_XML_PATTERNS)
-            # SwiftUI/Swift
-            elif ext == '.swift':
-                candidates.extend(SemanticAnchorResolver.SWIFTUI_PATTERNS)
-                candidates.extend(SemanticAnchorResolver.UIKIT_PATTERNS)
-            # React/Web
-            elif ext in ['.tsx', '.jsx', '.ts', '.js', '.html', '.css']:
-                candidates.extend(SemanticAnchorResolver.REACT_WEB_PATTERNS)
+            candidates.extend(
+                SemanticAnchorResolver.EXTENSION_PATTERNS.get(file_extension.lower(), ())
+            )
 
         return candidates
 
+    @staticmethod
+    def _prioritized_candidates(
+        issue: Dict, call_site_token: Optional[str], file_extension: Optional[str] = None
+    ) -> Tuple[List[str], List[int]]:
+        """
+        Build the prioritized anchor candidates for an issue.
+
+        Priority levels: 0 = call-site token from current_code, 1 = explicit
+        anchor_text, 2 = inferred from issue metadata and file extension.
+        Candidates are returned in ascending priority order.
+
+        Args:
+            issue: Issue dict
+            call_site_token: Token already extracted from the issue's current_code
+                (see extract_call_site_token), or None
+            file_extension: Optional file extension for framework inference
+
+        Returns:
+            Tuple of (candidates, priorities), index-aligned
+        """
+        explicit_anchor = issue.get('anchor_text') or issue.get('anchor')
+
+        anchor_candidates = []
+        candidate_priorities = []
+
+        # Highest priority: call-site token from current_code
+        if call_site_token:
+            anchor_candidates.append(call_site_token)
+            candidate_priorities.append(0)
+
+        # Next priority: explicit anchor_text
+        if explicit_anchor:
+            anchor_candidates.append(str(explicit_anchor))
+            candidate_priorities.append(1)
+
+        # Lower priority: infer from issue metadata. If an explicit anchor is
+        # provided WITHOUT current_code, don't use inferred candidates (the
+        # user explicitly specified where to anchor, so don't guess)
+        if not explicit_anchor or call_site_token:
+            inferred = SemanticAnchorResolver.extract_anchor_candidates(issue, file_extension)
+            anchor_candidates.extend(inferred)
+            candidate_priorities.extend([2] * len(inferred))
+
+        return anchor_candidates, candidate_priorities
+
     @staticmethod
     def resolve_anchor_line(
         issue: Dict,
@@ -311,51 +536,54 @@ class SemanticAnchorResolver:
                 print("  [anchor] No line texts available")
             return None, None
 
-        # Step 1: Extract call-site token from current_code (highest priority)
+        reference_line = issue.get('line', 0) or fallback_line or 0
+
+        # Fast path: the call-site token from current_code outranks every other
+        # candidate, so if it matches any line the nearest such line wins and
+        # the remaining candidates never need to be built or scanned
         call_site_token = SemanticAnchorResolver.extract_call_site_token(
             issue.get('current_code')
         )
-        
-        # Step 2: Get explicit anchor text from issue
-        explicit_anchor = issue.get('anchor_text') or issue.get('anchor')
-        
-        # Step 3: Build prioritized candidate list
-        # Priority levels: 0 = call-site, 1 = explicit anchor, 2 = inferred
-        # Special case: if explicit anchor is provided WITHOUT current_code, don't use inferred candidates
-        # (user explicitly specified where to anchor, so don't guess)
-        use_inferred = True
-        if explicit_anchor and not call_site_token:
-            # Only explicit anchor, no call-site - don't fall back to inferred
-            use_inferred = False
-        
-        anchor_candidates = []
-        candidate_priorities = []
-        
-        # Highest priority: call-site token from current_code
         if call_site_token:
-            anchor_candidates.append(call_site_token)
-            candidate_priorities.append(0)
-            if debug:
-                print(f"  [anchor] Extracted call-site token from current_code: {call_site_token}")
-        
-        # Next priority: explicit anchor_text
-        if explicit_anchor:
-            anchor_candidates.append(str(explicit_anchor))
-            candidate_priorities.append(1)
-            if debug:
-                print(f"  [anchor] Using explicit anchor_text: {explicit_anchor}")
-        
-        # Lower priority: infer from issue metadata (only if allowed)
-        if use_inferred:
-            inferred = SemanticAnchorResolver.extract_anchor_candidates(issue, file_extension)
-            for cand in inferred:
-                anchor_candidates.append(cand)
-                candidate_priorities.append(2)
-        else:
-            inferred = []
-        
+            token_lower = call_site_token.lower()
+            token_lines = sorted(
+                line_num for line_num, line_text in right_line_to_text.items()
+                if call_site_token in line_text or token_lower in line_text.lower()
+            )
+            if token_lines:
+                if reference_line > 0:
+                    resolved_line = token_lines[_pick_nearest(token_lines, reference_line)]
+                else:
+                    resolved_line = token_lines[0]
+                matched_text = right_line_to_text[resolved_line].strip()
+                if debug:
+                    print(f"  [anchor] Extracted call-site token from current_code: {call_site_token}")
+                    print(
+                        f"  [anchor] Resolved to line {resolved_line} "
+                        f"(call-site match on {len(token_lines)} lines): "
+                        f"{matched_text[:60]}"
+                    )
+                return resolved_line, matched_text
+
+        # Steps 1-3: Build prioritized candidate list
+        anchor_candidates, candidate_priorities = (
+            SemanticAnchorResolver._prioritized_candidates(
+                issue, call_site_token, file_extension
+            )
+        )
+
         if debug:
-            print(f"  [anchor] Total {len(anchor_candidates)} candidates (call-site: {1 if call_site_token else 0}, explicit: {1 if explicit_anchor else 0}, inferred: {len(inferred)})")
+            for candidate, priority in zip(anchor_candidates, candidate_priorities):
+                if priority == 0:
+                    print(f"  [anchor] Extracted call-site token from current_code: {candidate}")
+                elif priority == 1:
+                    print(f"  [anchor] Using explicit anchor_text: {candidate}")
+            print(
+                f"  [anchor] Total {len(anchor_candidates)} candidates "
+                f"(call-site: {candidate_priorities.count(0)}, "
+                f"explicit: {candidate_priorities.count(1)}, "
+                f"inferred: {candidate_priorities.count(2)})"
+            )
             if len(anchor_candidates) <= 10:
                 print(f"  [anchor] Candidates: {anchor_candidates}")
             else:
@@ -367,40 +595,33 @@ class SemanticAnchorResolver:
             return None, None
 
         # Step 4: Search for candidates in right_line_to_text
+        prepared = _prepare_candidates(anchor_candidates, candidate_priorities)
+
+        # A lone candidate (e.g. an explicit literal anchor_text) is already
+        # checked once per line, so a prefilter would only add a second scan.
+        prefilter = _build_candidate_prefilter(prepared) if len(prepared) > 1 else None
+
         matches = []  # List of (line_num, matched_text, candidate_pattern, priority)
         
         for line_num, line_text in right_line_to_text.items():
             if not line_text:
                 continue
+            if prefilter is not None and not prefilter.search(line_text):
+                continue
             
-            for idx, candidate in enumerate(anchor_candidates):
-                priority = candidate_priorities[idx]
-                
-                # Check if candidate is a regex pattern
-                is_regex_pattern = any(char in candidate for char in [r'\b', r'\s', r'\(', r'[', r'^', r'$', r'.', r'*'])
-                
-                try:
-                    if is_regex_pattern:
-                        # Use as regex pattern
-                        if re.search(candidate, line_text):
-                            matches.append((line_num, line_text.strip(), candidate, priority))
-                            break
-                        # Try case-insensitive for keyword patterns
-                        elif re.search(candidate, line_text, re.IGNORECASE):
-                            matches.append((line_num, line_text.strip(), candidate, priority))
-                            break
-                    else:
-                        # Try exact substring match (case-sensitive)
-                        if candidate in line_text:
-                            matches.append((line_num, line_text.strip(), candidate, priority))
-                            break
-                        # Try case-insensitive substring match
-                        elif candidate.lower() in line_text.lower():
-                            matches.append((line_num, line_text.strip(), candidate, priority))
-                            break
-                except re.error:
-                    # Invalid regex, skip
-                    continue
+            line_lower = None
+            for candidate, priority, pattern, candidate_lower in prepared:
+                if pattern is not None:
+                    if pattern.search(line_text):
+                        matches.append((line_num, line_text.strip(), candidate, priority))
+                        break
+                else:
+                    # Exact substring match, then case-insensitive
+                    if line_lower is None:
+                        line_lower = line_text.lower()
+                    if candidate in line_text or candidate_lower in line_lower:
+                        matches.append((line_num, line_text.strip(), candidate, priority))
+                        break
 
         if not matches:
             if debug:
@@ -432,23 +653,24 @@ class SemanticAnchorResolver:
         matches = priority_matches
         
         # Now choose closest to proposed line or fallback
-        reference_line = issue.get('line', 0) or fallback_line or 0
+
+        # Matches are collected in right_line_to_text order, which is already
+        # ascending for diff-derived mappings; only sort when it isn't
+        match_lines = [m[0] for m in matches]
+        if any(a > b for a, b in zip(match_lines, match_lines[1:])):
+            matches.sort(key=lambda x: x[0])  # Sort by line number
+            match_lines = [m[0] for m in matches]
         
         if reference_line > 0:
-            # Sort by distance from reference line
-            matches_with_distance = [
-                (line, text, abs(line - reference_line), pattern, prio)
-                for line, text, pattern, prio in matches
+            resolved_line, matched_text, _, prio = matches[
+                _pick_nearest(match_lines, reference_line)
             ]
-            matches_with_distance.sort(key=lambda x: x[2])  # Sort by distance
-            resolved_line, matched_text, distance, _, prio = matches_with_distance[0]
             rationale = ["call-site", "explicit anchor", "inferred"][prio]
             rationale += f", closest to {reference_line}"
             if debug:
                 print(f"  [anchor] Multiple matches, chose line {resolved_line} ({rationale}): {matched_text[:60]}")
         else:
             # No reference line, choose first match in line order
-            matches.sort(key=lambda x: x[0])  # Sort by line number
             resolved_line, matched_text, _, prio = matches[0]
             rationale = ["call-site", "explicit anchor", "inferred"][prio]
             rationale += ", first in line order"
@@ -457,6 +679,94 @@ class SemanticAnchorResolver:
 
         return resolved_line, matched_text
 
+    @staticmethod
+    def resolve_anchor_lines(
+        issues: List[Dict],
+        right_line_to_text: Dict[int, str],
+        file_extension: Optional[str] = None
+    ) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Resolve anchors for several issues in the same file with one line scan.
+
+        Gives the same result as calling resolve_anchor_line for each issue
+        (with its own 'line' as reference), but every distinct candidate is
+        matched against the file's lines once and shared across issues,
+        instead of rescanning the file per issue.
+
+        Args:
+            issues: Issue dicts, all for the same file
+            right_line_to_text: Dict mapping commentable RIGHT-side line numbers to their text
+            file_extension: Optional file extension for framework inference
+
+        Returns:
+            List of (resolved_line_number, matched_text) per issue, (None, None) if no match
+        """
+        results: List[Tuple[Optional[int], Optional[str]]] = [(None, None)] * len(issues)
+        if not right_line_to_text:
+            return results
+
+        issue_candidates = [
+            _prepare_candidates(
+                *SemanticAnchorResolver._prioritized_candidates(
+                    issue,
+                    SemanticAnchorResolver.extract_call_site_token(issue.get('current_code')),
+                    file_extension,
+                )
+            )
+            for issue in issues
+        ]
+
+        # Distinct candidates across all issues; priority is per issue
+        unique = {}
+        for prepared in issue_candidates:
+            for entry in prepared:
+                unique.setdefault(entry.candidate, entry)
+        if not unique:
+            return results
+
+        # Single scan: lines matched by each distinct candidate, in line order
+        candidate_lines: Dict[str, List[int]] = {candidate: [] for candidate in unique}
+        prefilter = _build_candidate_prefilter(list(unique.values()))
+        for line_num, line_text in right_line_to_text.items():
+            if not line_text:
+                continue
+            if prefilter is not None and not prefilter.search(line_text):
+                continue
+
+            line_lower = line_text.lower()
+            for candidate, _, pattern, candidate_lower in unique.values():
+                if pattern is not None:
+                    matched = pattern.search(line_text)
+                else:
+                    matched = candidate in line_text or candidate_lower in line_lower
+                if matched:
+                    candidate_lines[candidate].append(line_num)
+
+        for index, (issue, prepared) in enumerate(zip(issues, issue_candidates)):
+            # Candidates are in ascending priority order, so a line's priority
+            # is that of its first matching candidate; keep only the lines
+            # matched at the best priority any candidate reaches
+            best_priority = None
+            lines = set()
+            for entry in prepared:
+                if best_priority is not None and entry.priority > best_priority:
+                    break
+                if candidate_lines[entry.candidate]:
+                    best_priority = entry.priority
+                    lines.update(candidate_lines[entry.candidate])
+            if not lines:
+                continue
+
+            match_lines = sorted(lines)
+            reference_line = issue.get('line', 0) or 0
+            if reference_line > 0:
+                resolved_line = match_lines[_pick_nearest(match_lines, reference_line)]
+            else:
+                resolved_line = match_lines[0]
+            results[index] = (resolved_line, right_line_to_text[resolved_line].strip())
+
+        return results
+
     @staticmethod
     def resolve_issue_line(
         issue: Dict,
@@ -496,47 +806,55 @@ class SemanticAnchorResolver:
         if not candidates:
             return None
 
-        # Find all matching lines
-        matches = []
-        for line_num in commentable_lines:
+        # Compile each candidate once. Literal candidates are escaped; a
+        # case-insensitive match subsumes the case-sensitive one.
+        patterns = []
+        for candidate in candidates:
+            # Check if candidate is a regex pattern (contains regex metacharacters)
+            is_regex_pattern = any(marker in candidate for marker in ISSUE_LINE_REGEX_MARKERS)
+            pattern = _compile_anchor_pattern(
+                candidate if is_regex_pattern else re.escape(candidate), re.IGNORECASE
+            )
+            # If regex is invalid, skip this candidate
+            if pattern is not None:
+                patterns.append((candidate, pattern))
+
+        # One combined search rules out lines no candidate can match
+        # (backreferences would break inside the alternation, so skip it then)
+        prefilter = None
+        if not any(pattern.groups for _, pattern in patterns):
+            prefilter = _build_line_prefilter([pattern.pattern for _, pattern in patterns])
+
+        # Walk outward from the proposed line, nearest line first (the
+        # earlier one on equal distance), so the first match is the closest
+        # and lines beyond max_distance are never visited. Diff-derived
+        # commentable lines are already ascending, making the sort a single pass.
+        lines = sorted(commentable_lines)
+        hi = bisect_left(lines, proposed_line)
+        lo = hi - 1
+        while lo >= 0 or hi < len(lines):
+            if hi == len(lines) or (
+                lo >= 0 and proposed_line - lines[lo] <= lines[hi] - proposed_line
+            ):
+                line_num = lines[lo]
+                lo -= 1
+            else:
+                line_num = lines[hi]
+                hi += 1
+            if abs(line_num - proposed_line) > max_distance:
+                break
+
             line_text = line_texts.get(line_num, '')
             if not line_text:
                 continue
+            if prefilter is not None and not prefilter.search(line_text):
+                continue
 
-            for candidate in candidates:
-                # Check if candidate is a regex pattern (contains regex metacharacters)
-                is_regex_pattern = any(char in candidate for char in [r'\b', r'\s', r'\(', r'[', r'^', r'$'])
-                
-                try:
-                    # Try exact match first (case-sensitive for code patterns)
-                    pattern = candidate if is_regex_pattern else re.escape(candidate)
-                    if re.search(pattern, line_text):
-                        distance = abs(line_num - proposed_line)
-                        matches.append((line_num, distance, candidate))
-                        break
-                    # Try case-insensitive match for keywords
-                    elif re.search(pattern, line_text, re.IGNORECASE):
-                        distance = abs(line_num - proposed_line)
-                        matches.append((line_num, distance, candidate))
-                        break
-                except re.error:
-                    # If regex is invalid, skip this candidate
-                    continue
-
-        if not matches:
-            return None
-
-        # Filter by max distance
-        matches = [(line, dist, cand) for line, dist, cand in matches if dist <= max_distance]
-        if not matches:
-            return None
-
-        # Sort by distance (prefer closer to proposed line)
-        matches.sort(key=lambda x: x[1])
+            for _, pattern in patterns:
+                if pattern.search(line_text):
+                    return line_num
 
-        # Return closest match
-        resolved_line = matches[0][0]
-        return resolved_line
+        return None
 
     @staticmethod
     def get_all_framework_patterns() -> List[str]:
@@ -546,10 +864,4 @@ class SemanticAnchorResolver:
         Returns:
             List of regex patterns
         """
-        return (
-            SemanticAnchorResolver.COMPOSE_PATTERNS +
-            SemanticAnchorResolver.ANDROID_XML_PATTERNS +
-            SemanticAnchorResolver.SWIFTUI_PATTERNS +
-            SemanticAnchorResolver.UIKIT_PATTERNS +
-            SemanticAnchorResolver.REACT_WEB_PATTERNS
-        )
+        return list(SemanticAnchorResolver.ALL_FRAMEWORK_PATTERNS)
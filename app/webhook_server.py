@@ -5,12 +5,16 @@ Receives webhook events from GitHub and orchestrates accessibility reviews.
 """
 
 import os
+import sys
 import hmac
 import hashlib
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Dict, List, NamedTuple
 from flask import Flask, request, jsonify
 import requests
 from dotenv import load_dotenv
@@ -27,7 +31,7 @@ from app.sarif_generator import generate_and_write_sarif
 from app.platform_bucketing import (
     bucket_files_by_platform,
     get_platforms_in_order,
-    filter_locations_for_files,
+    bucket_locations_by_platform,
 )
 
 # Configure logging
@@ -44,6 +48,9 @@ app = Flask(__name__)
 WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "")
 PORT = int(os.getenv("PORT", "8080"))
 
+# Leading keyword of a normalized anchor (e.g. "textfield" in "textfield(")
+ANCHOR_KEYWORD_RE = re.compile(r"^([a-z0-9_]+)")
+
 # Initialize components
 github_auth = create_auth_from_env()
 pr_reviewer = create_reviewer_from_env()
@@ -347,16 +354,20 @@ def get_max_severity(issues: list) -> str:
     Returns:
         Maximum severity level: "critical", "major", "minor", or "info"
     """
-    severity_order = ["info", "minor", "major", "critical"]
-    max_severity = "info"
-
+    seen = set()
     for issue in issues:
         severity = issue.get("severity", "minor")
-        if severity in severity_order:
-            if severity_order.index(severity) > severity_order.index(max_severity):
-                max_severity = severity
+        # Nothing outranks critical, so stop at the first one
+        if severity == "critical":
+            return "critical"
+        if severity in ("major", "minor"):
+            seen.add(severity)
 
-    return max_severity
+    # Highest level present wins; info when there is nothing above it
+    for level in ("major", "minor"):
+        if level in seen:
+            return level
+    return "info"
 
 
 def determine_commit_status(issues: list) -> tuple:
@@ -387,6 +398,211 @@ def determine_commit_status(issues: list) -> tuple:
     return (status, description)
 
 
+class PostedLocation(NamedTuple):
+    """A posted comment location with its snippet pre-normalized for matching."""
+
+    line: int
+    snippet: str
+    # Snippet compared against issue titles: stripped, first 50 chars, lowercase
+    title: str
+    # Snippet compared against anchor signatures: whitespace removed, lowercase
+    signature: str
+
+
+def index_posted_locations(posted_locations) -> Dict[str, List[PostedLocation]]:
+    """
+    Group posted comment locations by file, sorted by line.
+
+    Supported entry shapes:
+    - 2-tuples: (file, line)
+    - 3+ tuples: (file, line, body_snippet, ...) - body_snippet used
+    - dicts: {'file': ..., 'line': ...} or {'path': ..., 'line': ...}
+
+    Malformed entries are skipped, including ones with a non-string path or
+    snippet or a non-numeric line, which could never suppress an issue.
+
+    Args:
+        posted_locations: Existing and already-posted comment locations
+
+    Returns:
+        Dict mapping file path to PostedLocation entries sorted by line
+    """
+    by_file: Dict[str, List[PostedLocation]] = {}
+    for entry in posted_locations:
+        # Handle dictionary entries
+        if isinstance(entry, dict):
+            existing_file = entry.get("file") or entry.get("path")
+            existing_line = entry.get("line")
+            existing_snippet = entry.get("snippet", "")
+            if not existing_file or not existing_line:
+                continue
+        # Handle tuple/list entries with 2+ values
+        elif isinstance(entry, (tuple, list)) and len(entry) >= 2:
+            existing_file = entry[0]
+            existing_line = entry[1]
+            # Extract body snippet if available (3rd element)
+            existing_snippet = ""
+            if len(entry) >= 3:
+                existing_snippet = str(entry[2]) if entry[2] else ""
+        else:
+            # Skip malformed entries
+            continue
+
+        # Only a string path can equal the issue's file, only a numeric line
+        # has a distance, and only a string snippet can identify the issue
+        if not (
+            isinstance(existing_file, str)
+            and isinstance(existing_line, (int, float))
+            and isinstance(existing_snippet, str)
+        ):
+            continue
+
+        by_file.setdefault(existing_file, []).append(
+            PostedLocation(
+                existing_line,
+                existing_snippet,
+                existing_snippet.strip()[:50].lower(),
+                "".join(existing_snippet.split()).lower(),
+            )
+        )
+
+    for entries in by_file.values():
+        entries.sort(key=itemgetter(0))
+    return by_file
+
+
+def is_near_existing_comment(
+    locations_by_file: Dict[str, List[PostedLocation]],
+    file_path: str,
+    line: int,
+    issue: Dict = None,
+    range_threshold: int = 5,
+) -> tuple:
+    """
+    Check if a location is near any existing comment AND if it's the same issue.
+
+    This refined logic prevents suppressing corrected anchors while still
+    avoiding true duplicates. It checks:
+    1. Same file AND same issue identity (title match or anchor signature)
+    2. Proximity alone is NOT sufficient to suppress
+
+    Only existing comments in the same file within range_threshold lines are
+    examined, in line order, found by bisecting into the per-file index.
+
+    Args:
+        locations_by_file: Existing and already-posted comment locations,
+            as indexed by index_posted_locations
+        file_path: File path of the issue to check
+        line: Line number of the issue to check
+        issue: Issue dict with title, anchor_text, etc. (optional)
+        range_threshold: Line distance threshold (default: 5)
+
+    Returns:
+        Tuple of (should_skip: bool, skip_reason: str, matched_entry or None)
+    """
+    # Extract issue identity for matching
+    issue_title = ""
+    issue_anchor = ""
+    if issue:
+        issue_title = str(issue.get("title", "")).strip()[:50].lower()
+        # Get anchor signature
+        if issue.get("_anchor_matched_text"):
+            anchor_src = issue.get("_anchor_matched_text", "")
+            issue_anchor = str(anchor_src).strip().lower()
+        elif issue.get("anchor_text"):
+            issue_anchor = str(issue.get("anchor_text", "")).strip().lower()
+
+    # Suppression requires an identity match, so without a title or anchor
+    # nothing can be suppressed and no existing comment needs to be examined
+    if not (issue_title or issue_anchor):
+        return (False, "", None)
+
+    entries = locations_by_file.get(file_path)
+    if not entries:
+        return (False, "", None)
+
+    # Anchor signature, normalized once: whitespace-free, lowercase, and its
+    # leading keyword (before parenthesis/special chars) if long enough
+    anchor_normalized = "".join(issue_anchor.split()).lower()[:40]
+    anchor_keyword = ""
+    keyword_match = ANCHOR_KEYWORD_RE.match(anchor_normalized)
+    if keyword_match and len(keyword_match.group(1)) >= 4:
+        anchor_keyword = keyword_match.group(1)
+
+    # Non-numeric line can't be near anything
+    if not isinstance(line, (int, float)):
+        return (False, "", None)
+
+    start = bisect_left(entries, line - range_threshold, key=itemgetter(0))
+
+    for location in entries[start:]:
+        # Entries are sorted, so everything after this is out of range too
+        if location.line > line + range_threshold:
+            break
+        existing_line, existing_snippet, existing_title, snippet_normalized = location
+        distance = abs(existing_line - line)
+
+        # Within range - now check if it's the SAME issue
+        is_same_issue = False
+        match_reason = ""
+
+        # Check title match
+        if issue_title and existing_title:
+            # Fuzzy match: check if titles are similar enough
+            # (at least 30 chars match or 80% of shorter title)
+            if issue_title == existing_title:
+                is_same_issue = True
+                match_reason = "exact title match"
+            elif (
+                len(issue_title) >= 30
+                and len(existing_title) >= 30
+                # A prefix match needs the first characters to agree
+                and issue_title[0] == existing_title[0]
+            ):
+                # For longer titles, check prefix match (80% of shorter)
+                min_len = min(len(issue_title), len(existing_title))
+                threshold = min_len * 4 // 5
+                if issue_title.startswith(existing_title[:threshold]):
+                    is_same_issue = True
+                    match_reason = "fuzzy title match"
+
+        # Check anchor match (if title didn't match)
+        if not is_same_issue and issue_anchor and existing_snippet:
+            # Check if anchor text appears in existing snippet; the
+            # snippet signature is normalized the same way as the anchor
+
+            # Try substring match
+            if len(anchor_normalized) >= 3 and anchor_normalized in snippet_normalized:
+                is_same_issue = True
+                match_reason = "anchor signature match"
+
+            # Try matching keyword (before parenthesis/special)
+            elif anchor_keyword and anchor_keyword in snippet_normalized:
+                is_same_issue = True
+                match_reason = "anchor signature match"
+
+        # If same issue detected, skip it
+        if is_same_issue:
+            matched_entry = {
+                "file": file_path,
+                "line": existing_line,
+                "distance": distance,
+                "snippet": existing_snippet[:100],
+            }
+            return (True, match_reason, matched_entry)
+
+        # Within range but NOT same issue - different/corrected
+        # anchor or different issue. Do NOT suppress.
+        logger.debug(
+            f"Location {file_path}:{line} is near "
+            f"{file_path}:{existing_line} (distance={distance}) "
+            f"but appears to be a different issue. Not suppressing."
+        )
+
+    # No matching existing comment found
+    return (False, "", None)
+
+
 def handle_pull_request(payload: dict):
     """
     Handle pull_request webhook event.
@@ -451,7 +667,8 @@ def handle_pull_request(payload: dict):
         files_response = requests.get(files_url, headers=headers)
         files_response.raise_for_status()
         files_data = files_response.json()
-        all_files = [f["filename"] for f in files_data]
+        # Interned so every later set/dict lookup on these paths can match by identity
+        all_files = [sys.intern(f["filename"]) for f in files_data]
 
         # Filter out non-reviewable files (docs, build config, etc.)
         changed_files = filter_reviewable_files(all_files)
@@ -469,7 +686,8 @@ def handle_pull_request(payload: dict):
                 for f in changed_files
                 if any(f.endswith(ext) for ext in WEB_EXTENSIONS)
             ]
-            non_web_files = [f for f in changed_files if f not in web_files]
+            web_file_set = set(web_files)
+            non_web_files = [f for f in changed_files if f not in web_file_set]
 
             logger.info("[DEBUG_WEB_REVIEW] File categorization:")
             logger.info(f"  All changed files ({len(all_files)}): {all_files}")
@@ -540,164 +758,6 @@ def handle_pull_request(payload: dict):
         # Track phase state for multi-platform reviews
         phase_state = {"current_phase": 0, "total_phases": len(platforms_in_order)}
 
-        def is_near_existing_comment(
-            file_path: str, line: int, issue: Dict = None, range_threshold: int = 5
-        ) -> tuple:
-            """
-            Check if a location is near any existing comment AND if it's the same issue.
-
-            This refined logic prevents suppressing corrected anchors while still
-            avoiding true duplicates. It checks:
-            1. Same file AND same issue identity (title match or anchor signature)
-            2. Proximity alone is NOT sufficient to suppress
-
-            Supports multiple entry shapes in posted_locations:
-            - 2-tuples: (file, line)
-            - 3+ tuples: (file, line, body_snippet, ...) - body_snippet used
-            - dicts: {'file': ..., 'line': ...} or {'path': ..., 'line': ...}
-            - Malformed entries are skipped safely
-
-            Args:
-                file_path: File path of the issue to check
-                line: Line number of the issue to check
-                issue: Issue dict with title, anchor_text, etc. (optional)
-                range_threshold: Line distance threshold (default: 5)
-
-            Returns:
-                Tuple of (should_skip: bool, skip_reason: str, matched_entry or None)
-            """
-            # Extract issue identity for matching
-            issue_title = ""
-            issue_anchor = ""
-            if issue:
-                issue_title = str(issue.get("title", "")).strip()[:50].lower()
-                # Get anchor signature
-                if issue.get("_anchor_matched_text"):
-                    anchor_src = issue.get("_anchor_matched_text", "")
-                    issue_anchor = str(anchor_src).strip().lower()
-                elif issue.get("anchor_text"):
-                    issue_anchor = str(issue.get("anchor_text", "")).strip().lower()
-
-            for entry in posted_locations:
-                try:
-                    # Parse entry based on type
-                    existing_file = None
-                    existing_line = None
-                    existing_snippet = ""
-
-                    # Handle dictionary entries
-                    if isinstance(entry, dict):
-                        existing_file = entry.get("file") or entry.get("path")
-                        existing_line = entry.get("line")
-                        existing_snippet = entry.get("snippet", "")
-                        if not existing_file or not existing_line:
-                            continue
-                    # Handle tuple/list entries with 2+ values
-                    elif isinstance(entry, (tuple, list)) and len(entry) >= 2:
-                        existing_file = entry[0]
-                        existing_line = entry[1]
-                        # Extract body snippet if available (3rd element)
-                        if len(entry) >= 3:
-                            existing_snippet = str(entry[2]) if entry[2] else ""
-                    else:
-                        # Skip malformed entries
-                        continue
-
-                    # Check if same file
-                    if existing_file != file_path:
-                        continue
-
-                    # Calculate distance
-                    distance = abs(existing_line - line)
-
-                    # Check if within range
-                    if distance > range_threshold:
-                        continue
-
-                    # Within range - now check if it's the SAME issue
-                    is_same_issue = False
-                    match_reason = ""
-
-                    # If we have issue metadata, check for identity match
-                    if issue and (issue_title or issue_anchor):
-                        # Normalize existing snippet for comparison
-                        existing_title = existing_snippet.strip()[:50].lower()
-
-                        # Check title match
-                        if issue_title and existing_title:
-                            # Fuzzy match: check if titles are similar enough
-                            # (at least 30 chars match or 80% of shorter title)
-                            if issue_title == existing_title:
-                                is_same_issue = True
-                                match_reason = "exact title match"
-                            elif len(issue_title) >= 30 and len(existing_title) >= 30:
-                                # For longer titles, check prefix match
-                                min_len = min(len(issue_title), len(existing_title))
-                                threshold = int(min_len * 0.8)
-                                if (
-                                    issue_title[:threshold]
-                                    == existing_title[:threshold]
-                                ):
-                                    is_same_issue = True
-                                    match_reason = "fuzzy title match"
-
-                        # Check anchor match (if title didn't match)
-                        if not is_same_issue and issue_anchor and existing_snippet:
-                            # Check if anchor text appears in existing snippet
-                            # Normalize both for comparison
-                            anchor_norm = "".join(issue_anchor.split()).lower()
-                            anchor_normalized = anchor_norm[:40]
-                            snippet_norm = "".join(existing_snippet.split())
-                            snippet_normalized = snippet_norm.lower()
-
-                            # Try substring match
-                            if anchor_normalized and len(anchor_normalized) >= 3:
-                                if anchor_normalized in snippet_normalized:
-                                    is_same_issue = True
-                                    match_reason = "anchor signature match"
-
-                            # Try matching keyword (before parenthesis/special)
-                            if not is_same_issue and anchor_normalized:
-                                # Extract keyword: alphanumeric before special
-                                import re
-
-                                keyword_match = re.match(
-                                    r"^([a-z0-9_]+)", anchor_normalized
-                                )
-                                if keyword_match:
-                                    keyword = keyword_match.group(1)
-                                    if (
-                                        len(keyword) >= 4
-                                        and keyword in snippet_normalized
-                                    ):
-                                        is_same_issue = True
-                                        match_reason = "anchor signature match"
-
-                    # If same issue detected, skip it
-                    if is_same_issue:
-                        matched_entry = {
-                            "file": existing_file,
-                            "line": existing_line,
-                            "distance": distance,
-                            "snippet": existing_snippet[:100],
-                        }
-                        return (True, match_reason, matched_entry)
-
-                    # Within range but NOT same issue - different/corrected
-                    # anchor or different issue. Do NOT suppress.
-                    logger.debug(
-                        f"Location {file_path}:{line} is near "
-                        f"{existing_file}:{existing_line} (distance={distance}) "
-                        f"but appears to be a different issue. Not suppressing."
-                    )
-
-                except (TypeError, ValueError, IndexError, AttributeError):
-                    # Skip malformed entries safely
-                    continue
-
-            # No matching existing comment found
-            return (False, "", None)
-
         def post_batch_comments(issues):
             """Callback to post comments progressively as batches complete."""
             nonlocal all_issues, posted_locations
@@ -712,6 +772,10 @@ def handle_pull_request(payload: dict):
 
             # Filter out issues at locations we've already posted or near existing comments
             new_issues = []
+            # Index once per batch. Locations added below are bare (file, line)
+            # pairs with no snippet, which never match an issue's identity, so
+            # they don't need to be added to the index.
+            locations_by_file = index_posted_locations(posted_locations)
             for issue in issues:
                 file_path = issue.get("file", "")
                 line = issue.get("line", 0)
@@ -737,7 +801,7 @@ def handle_pull_request(payload: dict):
 
                 # Check for nearby existing comments with smart identity matching
                 should_skip, skip_reason, matched_entry = is_near_existing_comment(
-                    file_path, line, issue
+                    locations_by_file, file_path, line, issue
                 )
 
                 if should_skip:
@@ -819,6 +883,14 @@ def handle_pull_request(payload: dict):
                 total_phases=total_phases_num,
             )
 
+        # Split existing comments and threads by platform once, up front
+        existing_by_platform = bucket_locations_by_platform(
+            existing_locations, platform_buckets
+        )
+        threads_by_platform = bucket_locations_by_platform(
+            review_threads, platform_buckets
+        )
+
         # Perform phased review - one platform at a time
         logger.info("Starting platform-phased accessibility review...")
 
@@ -841,10 +913,8 @@ def handle_pull_request(payload: dict):
             platform_guides = guide_loader.load_platform_specific_guides([platform])
             logger.info(f"Loaded guides: {len(platform_guides)} characters")
 
-            # Filter existing_comments to only include files in this phase
-            phase_existing_comments = filter_locations_for_files(
-                list(existing_locations), platform_files
-            )
+            # Existing comments for files in this phase
+            phase_existing_comments = existing_by_platform[platform]
             logger.info(
                 f"Filtered existing comments: {len(phase_existing_comments)} "
                 f"(out of {len(existing_locations)} total)"
@@ -883,10 +953,8 @@ def handle_pull_request(payload: dict):
                     else "  Entry format: unknown"
                 )
 
-            # Filter review_threads to only include files in this phase
-            phase_review_threads = filter_locations_for_files(
-                review_threads, platform_files
-            )
+            # Review threads for files in this phase
+            phase_review_threads = threads_by_platform[platform]
             logger.info(
                 f"Filtered review threads: {len(phase_review_threads)} "
                 f"(out of {len(review_threads)} total)"
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+from unittest.mock import patch
+from app.pr_reviewer import PRReviewer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patch_openai():
+    """Mock the openai client once for the whole session to avoid actual API calls."""
+    with patch("app.pr_reviewer.openai.OpenAI"):
+        yield
+
+
+@pytest.fixture
+def reviewer():
+    """Create a fresh mock PRReviewer instance for each test."""
+    return PRReviewer(
+        scout_api_key="test-key",
+        scout_base_url="https://test.example.com",
+        scout_model="test-model",
+    )
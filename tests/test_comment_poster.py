@@ -9,6 +9,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from app.comment_poster import (
     CommentPoster,
+    ExistingCommentLocation,
     get_app_version,
     get_debug_footer,
 )
@@ -273,5 +274,38 @@ class TestPhasedReviewSummary:
             assert "Found 3 accessibility issue(s)" in payload["body"]
 
 
+class TestExistingCommentLocations:
+    """Tests for fetching existing review comment locations."""
+
+    def test_locations_are_named_tuples(self):
+        """Test that existing locations are tuples with named fields."""
+        poster = CommentPoster()
+
+        with patch("app.comment_poster.requests.get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.json.return_value = [
+                {
+                    "path": "web/Button.tsx",
+                    "line": 12,
+                    "body": "## 🟠 Accessibility Issue: Missing label\nDetails",
+                },
+                {"path": "web/Form.tsx", "original_line": 4, "body": "Nit"},
+                {"path": None, "line": 1, "body": "Outdated"},
+            ]
+            mock_get.return_value = mock_response
+
+            locations = poster._get_existing_comment_locations(
+                "owner", "repo", 1, {"Authorization": "token test"}
+            )
+
+        assert locations == {
+            ("web/Button.tsx", 12, "Missing label"),
+            ("web/Form.tsx", 4, ""),
+        }
+        for location in locations:
+            assert isinstance(location, ExistingCommentLocation)
+            assert location == (location.path, location.line, location.snippet)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
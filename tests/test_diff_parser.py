@@ -5,11 +5,13 @@ Validates diff parsing, line mapping, and validation logic.
 """
 
 import pytest
+from unittest.mock import patch
 from app.diff_parser import (
     DiffParser,
     validate_issues_in_batch,
     is_no_issues_placeholder,
 )
+from app.semantic_anchor_resolver import SemanticAnchorResolver
 
 # Test fixtures - sample diffs
 SAMPLE_SINGLE_FILE_DIFF = """diff --git a/app/test.py b/app/test.py
@@ -80,6 +82,15 @@ class TestDiffParser:
         assert "file1" in result["app/file1.py"]
         assert "file2" in result["app/file2.js"]
 
+    def test_filter_diff_with_preparsed_sections(self):
+        """Test that passing a prior parse_diff result filters the same way."""
+        parsed = DiffParser.parse_diff(SAMPLE_MULTI_FILE_DIFF)
+
+        for file_path in ["app/file1.py", "app/file2.js"]:
+            assert DiffParser.filter_diff_for_files(
+                SAMPLE_MULTI_FILE_DIFF, [file_path], parsed=parsed
+            ) == DiffParser.filter_diff_for_files(SAMPLE_MULTI_FILE_DIFF, [file_path])
+
     def test_filter_diff_for_single_file(self):
         """Test filtering diff to single file."""
         parser = DiffParser()
@@ -272,6 +283,66 @@ class TestValidateIssuesInBatch:
         # Should be dropped (no line within max_distance=10)
         assert len(result) == 0
 
+    def test_validate_issues_reuses_precomputed_line_texts(self):
+        """Test that supplied line texts are used instead of re-parsing the diff."""
+        parsed = SemanticAnchorResolver.parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+        issues = [{"file": "app/test.py", "line": 1, "title": "Issue 1"}]
+
+        with patch.object(
+            SemanticAnchorResolver, "extract_commentable_line_texts"
+        ) as mock_extract:
+            result = validate_issues_in_batch(
+                issues,
+                ["app/test.py"],
+                parsed.commentable,
+                SAMPLE_SINGLE_FILE_DIFF,
+                line_texts=parsed.texts,
+            )
+
+        mock_extract.assert_not_called()
+        assert [issue["line"] for issue in result] == [1]
+
+    def test_validate_issues_batches_anchor_resolution_per_file(self):
+        """Test that several issues in one file share a single anchor scan."""
+        parsed = SemanticAnchorResolver.parse_diff(SAMPLE_SINGLE_FILE_DIFF)
+        issues = [
+            {
+                "file": "app/test.py",
+                "line": 30,
+                "title": "Issue",
+                "anchor_text": "def hello",
+            },
+            {
+                "file": "app/test.py",
+                "line": 40,
+                "title": "Issue",
+                "anchor_text": "New comment",
+            },
+        ]
+
+        with patch.object(
+            SemanticAnchorResolver,
+            "resolve_anchor_lines",
+            wraps=SemanticAnchorResolver.resolve_anchor_lines,
+        ) as mock_batch, patch.object(
+            SemanticAnchorResolver, "resolve_anchor_line"
+        ) as mock_single:
+            result = validate_issues_in_batch(
+                issues,
+                ["app/test.py"],
+                parsed.commentable,
+                SAMPLE_SINGLE_FILE_DIFF,
+                line_texts=parsed.texts,
+            )
+
+        mock_batch.assert_called_once()
+        mock_single.assert_not_called()
+        texts = parsed.texts["app/test.py"]
+        assert [texts[issue["line"]] for issue in result] == [
+            "def hello():",
+            "    # New comment",
+        ]
+
 
 class TestIsNoIssuesPlaceholder:
     """Tests for is_no_issues_placeholder function."""
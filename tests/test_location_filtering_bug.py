@@ -116,6 +116,19 @@ class TestLocationFilteringBug:
         # Both should match after normalization
         assert len(filtered) == 2
 
+    def test_path_normalization_preserves_case(self):
+        """Test that path comparison stays case-sensitive."""
+        locations = [
+            ("web\\src\\button.tsx", 10, "Issue"),
+            ("web\\src\\Button.tsx", 20, "Issue"),
+        ]
+
+        files = ["web/src/Button.tsx"]
+
+        filtered = filter_locations_for_files(locations, files)
+
+        assert filtered == [("web\\src\\Button.tsx", 20, "Issue")]
+
     def test_review_threads_with_nested_comment_path(self):
         """
         Test filtering when path is in a nested comment object.
@@ -339,3 +352,19 @@ class TestLocationFilteringBug:
         
         # Should skip empty strings and find the path
         assert path == "web/Button.tsx"
+
+    def test_dict_path_keys_checked_in_order(self):
+        """
+        Test that dict entries resolve 'path', then 'file', then 'file_path',
+        falling back to the nested comment object.
+        """
+        from app.platform_bucketing import extract_path_from_entry
+
+        assert extract_path_from_entry({"path": "a/1.kt", "file": "b/2.kt"}) == "a/1.kt"
+        assert extract_path_from_entry({"path": "", "file": "b/2.kt"}) == "b/2.kt"
+        assert extract_path_from_entry({"file_path": "c/3.kt"}) == "c/3.kt"
+        assert (
+            extract_path_from_entry({"line": 1, "comment": {"file_path": "d/4.kt"}})
+            == "d/4.kt"
+        )
+        assert extract_path_from_entry({"line": 1, "comment": "not a dict"}) == ""
@@ -6,7 +6,10 @@ available on the first running phase and then ignored for following ones.
 """
 
 import pytest
-from app.platform_bucketing import filter_locations_for_files
+from app.platform_bucketing import (
+    bucket_locations_by_platform,
+    filter_locations_for_files,
+)
 
 
 class TestMultiphaseExistingComments:
@@ -40,9 +43,7 @@ class TestMultiphaseExistingComments:
 
         # PHASE 1: Android
         android_files = ["android/MainActivity.kt", "android/Fragment.java"]
-        android_comments = filter_locations_for_files(
-            list(existing_locations), android_files
-        )
+        android_comments = filter_locations_for_files(existing_locations, android_files)
 
         # Should find 2 Android comments
         assert len(android_comments) == 2
@@ -52,7 +53,7 @@ class TestMultiphaseExistingComments:
 
         # PHASE 2: iOS
         ios_files = ["ios/ViewController.swift", "ios/Bridge.m"]
-        ios_comments = filter_locations_for_files(list(existing_locations), ios_files)
+        ios_comments = filter_locations_for_files(existing_locations, ios_files)
 
         # Should STILL find 2 iOS comments (existing_locations unchanged)
         assert len(ios_comments) == 2, (
@@ -65,7 +66,7 @@ class TestMultiphaseExistingComments:
 
         # PHASE 3: Web
         web_files = ["web/src/Button.tsx", "web/src/Form.tsx"]
-        web_comments = filter_locations_for_files(list(existing_locations), web_files)
+        web_comments = filter_locations_for_files(existing_locations, web_files)
 
         # Should STILL find 2 Web comments (existing_locations unchanged)
         assert len(web_comments) == 2, (
@@ -182,6 +183,24 @@ class TestMultiphaseExistingComments:
         # Verify original set is unchanged
         assert original_set == original_copy, "Original set should not be modified"
 
+    def test_filter_accepts_set_and_generator_directly(self):
+        """
+        Test that filter_locations_for_files accepts any iterable without
+        callers having to copy it into a list first.
+        """
+        locations = {
+            ("android/MainActivity.kt", 10, "Issue 1"),
+            ("ios/ViewController.swift", 20, "Issue 2"),
+        }
+
+        from_set = filter_locations_for_files(locations, ["android/MainActivity.kt"])
+        from_generator = filter_locations_for_files(
+            (entry for entry in locations), ["android/MainActivity.kt"]
+        )
+
+        assert from_set == [("android/MainActivity.kt", 10, "Issue 1")]
+        assert from_generator == from_set
+
     def test_filter_does_not_modify_input_list(self):
         """
         Test that filter_locations_for_files does not modify the input
@@ -205,3 +224,29 @@ class TestMultiphaseExistingComments:
         # Verify original list is unchanged
         assert original_list == original_copy, "Original list should not be modified"
         assert len(original_list) == 3, "Original list size should not change"
+
+    def test_bucket_locations_matches_per_phase_filtering(self):
+        """
+        Test that bucketing locations once gives each phase the same entries
+        as filtering per phase.
+        """
+        platform_buckets = {
+            "Android": ["android/MainActivity.kt"],
+            "iOS": ["ios/ViewController.swift"],
+            "Web": ["web/src/Button.tsx"],
+            "React Native": [],
+            "Flutter": [],
+        }
+        locations = [
+            ("android/MainActivity.kt", 10, "Issue 1"),
+            {"path": "ios/ViewController.swift", "line": 20},
+            ("web\\src\\Button.tsx", 30, "Issue 3"),
+            ("docs/README.md", 40, "Not reviewed"),
+        ]
+
+        by_platform = bucket_locations_by_platform(locations, platform_buckets)
+
+        assert set(by_platform) == set(platform_buckets)
+        for platform, files in platform_buckets.items():
+            assert by_platform[platform] == filter_locations_for_files(locations, files)
+        assert by_platform["Android"][0] is locations[0]
@@ -5,21 +5,21 @@ Tests platform detection, file bucketing, and location filtering.
 """
 
 import pytest
+from typing import Final
+from unittest.mock import patch
+
 from app.platform_bucketing import (
     detect_react_native_in_diff,
+    detect_react_native_files,
     bucket_files_by_platform,
     get_platforms_in_order,
     filter_locations_for_files,
     PLATFORM_ORDER,
+    _has_react_native_signal,
 )
 
 
-class TestReactNativeDetection:
-    """Tests for React Native content-based detection."""
-    
-    def test_detect_rn_import_from(self):
-        """Test detection of React Native via 'from' import."""
-        pr_diff = """
+_DIFF_RN_FROM_IMPORT: Final[str] = """
 diff --git a/App.tsx b/App.tsx
 index 123..456 789
 --- a/App.tsx
@@ -31,11 +31,8 @@ index 123..456 789
 +  return <View><Text>Hello</Text></View>;
 +}
 """
-        assert detect_react_native_in_diff("App.tsx", pr_diff) is True
-    
-    def test_detect_rn_require(self):
-        """Test detection of React Native via require."""
-        pr_diff = """
+
+_DIFF_RN_REQUIRE: Final[str] = """
 diff --git a/components/Button.js b/components/Button.js
 index 123..456 789
 --- a/components/Button.js
@@ -43,11 +40,8 @@ index 123..456 789
 @@ -1,3 +1,3 @@
 +const { TouchableOpacity } = require('react-native');
 """
-        assert detect_react_native_in_diff("components/Button.js", pr_diff) is True
-    
-    def test_detect_rn_component_tags(self):
-        """Test detection via React Native component tags."""
-        pr_diff = """
+
+_DIFF_RN_COMPONENT_TAGS: Final[str] = """
 diff --git a/screens/Home.tsx b/screens/Home.tsx
 index 123..456 789
 --- a/screens/Home.tsx
@@ -64,11 +58,8 @@ index 123..456 789
 +  );
 +}
 """
-        assert detect_react_native_in_diff("screens/Home.tsx", pr_diff) is True
-    
-    def test_no_rn_detection_web(self):
-        """Test that pure web React files are not detected as RN."""
-        pr_diff = """
+
+_DIFF_WEB_BUTTON: Final[str] = """
 diff --git a/components/Button.tsx b/components/Button.tsx
 index 123..456 789
 --- a/components/Button.tsx
@@ -80,12 +71,89 @@ index 123..456 789
 +  return <button>Click me</button>;
 +}
 """
-        assert detect_react_native_in_diff("components/Button.tsx", pr_diff) is False
+
+_DIFF_MIXED_RN_WEB: Final[str] = """
+diff --git a/mobile/App.tsx b/mobile/App.tsx
+--- a/mobile/App.tsx
++++ b/mobile/App.tsx
+@@ -1,1 +1,1 @@
++import { View } from 'react-native';
+diff --git a/web/Button.tsx b/web/Button.tsx
+--- a/web/Button.tsx
++++ b/web/Button.tsx
+@@ -1,1 +1,1 @@
++import React from 'react';
+diff --git a/mobile/List.js b/mobile/List.js
+--- a/mobile/List.js
++++ b/mobile/List.js
+@@ -1,1 +1,1 @@
++  return <FlatList data={items} />;
+"""
+
+_DIFF_RN_BUTTON: Final[str] = """
+diff --git a/components/Button.tsx b/components/Button.tsx
+index 123..456 789
+--- a/components/Button.tsx
++++ b/components/Button.tsx
+@@ -1,3 +1,5 @@
++import { TouchableOpacity, Text } from 'react-native';
++export default function Button() {
++  return <TouchableOpacity><Text>Click</Text></TouchableOpacity>;
++}
+"""
+
+_DIFF_RN_APP_VIEW: Final[str] = """
+diff --git a/App.tsx b/App.tsx
+--- a/App.tsx
++++ b/App.tsx
+@@ -1,1 +1,1 @@
++import { View } from 'react-native';
+"""
+
+
+class TestReactNativeDetection:
+    """Tests for React Native content-based detection."""
     
-    def test_no_rn_detection_empty_diff(self):
-        """Test that empty diff returns False."""
-        pr_diff = ""
-        assert detect_react_native_in_diff("App.tsx", pr_diff) is False
+    @pytest.mark.parametrize(
+        "file_path, pr_diff, expected",
+        [
+            pytest.param("App.tsx", _DIFF_RN_FROM_IMPORT, True, id="import-from"),
+            pytest.param("components/Button.js", _DIFF_RN_REQUIRE, True, id="require"),
+            pytest.param(
+                "screens/Home.tsx", _DIFF_RN_COMPONENT_TAGS, True, id="component-tags"
+            ),
+            pytest.param("components/Button.tsx", _DIFF_WEB_BUTTON, False, id="web"),
+            pytest.param("App.tsx", "", False, id="empty-diff"),
+            pytest.param(
+                "App.kt",
+                _DIFF_RN_FROM_IMPORT.replace("App.tsx", "App.kt"),
+                False,
+                id="non-js-extension",
+            ),
+        ],
+    )
+    def test_detect_rn(self, file_path, pr_diff, expected):
+        """Test React Native detection from imports, requires, and component tags."""
+        assert detect_react_native_in_diff(file_path, pr_diff) is expected
+
+    def test_detect_rn_skips_regex_without_literal_signal(self):
+        """Test that diffs without any RN literal never reach the regex."""
+        with patch("app.platform_bucketing.RN_SIGNAL_RE") as mock_re:
+            assert _has_react_native_signal("Button.tsx", _DIFF_WEB_BUTTON) is False
+            assert _has_react_native_signal("App.tsx", _DIFF_RN_FROM_IMPORT) is True
+
+        assert mock_re.search.call_count == 1
+
+    def test_detect_rn_files_matches_per_file_detection(self):
+        """Test that batch detection agrees with per-file detection."""
+        files = ["mobile/App.tsx", "web/Button.tsx", "List.js", "missing.tsx"]
+
+        rn_files = detect_react_native_files(files, _DIFF_MIXED_RN_WEB)
+
+        assert rn_files == {"mobile/App.tsx", "List.js"}
+        for file_path in files:
+            expected = detect_react_native_in_diff(file_path, _DIFF_MIXED_RN_WEB)
+            assert (file_path in rn_files) is expected
 
 
 class TestFileBucketing:
@@ -145,19 +213,8 @@ class TestFileBucketing:
     def test_bucket_web_tsx_without_rn(self):
         """Test that .tsx files without RN are bucketed as Web."""
         files = ["components/Button.tsx"]
-        pr_diff = """
-diff --git a/components/Button.tsx b/components/Button.tsx
-index 123..456 789
---- a/components/Button.tsx
-+++ b/components/Button.tsx
-@@ -1,3 +1,3 @@
-+import React from 'react';
-+export default function Button() {
-+  return <button>Click</button>;
-+}
-"""
         
-        buckets = bucket_files_by_platform(files, pr_diff)
+        buckets = bucket_files_by_platform(files, _DIFF_WEB_BUTTON)
         
         assert len(buckets["Web"]) == 1
         assert "components/Button.tsx" in buckets["Web"]
@@ -166,19 +223,8 @@ index 123..456 789
     def test_bucket_react_native_tsx_with_rn(self):
         """Test that .tsx files with RN are bucketed as React Native."""
         files = ["components/Button.tsx"]
-        pr_diff = """
-diff --git a/components/Button.tsx b/components/Button.tsx
-index 123..456 789
---- a/components/Button.tsx
-+++ b/components/Button.tsx
-@@ -1,3 +1,5 @@
-+import { TouchableOpacity, Text } from 'react-native';
-+export default function Button() {
-+  return <TouchableOpacity><Text>Click</Text></TouchableOpacity>;
-+}
-"""
         
-        buckets = bucket_files_by_platform(files, pr_diff)
+        buckets = bucket_files_by_platform(files, _DIFF_RN_BUTTON)
         
         assert len(buckets["React Native"]) == 1
         assert "components/Button.tsx" in buckets["React Native"]
@@ -193,16 +239,8 @@ index 123..456 789
             "App.tsx",
             "main.dart",
         ]
-        pr_diff = """
-diff --git a/App.tsx b/App.tsx
-index 123..456 789
---- a/App.tsx
-+++ b/App.tsx
-@@ -1,3 +1,3 @@
-+import { View } from 'react-native';
-"""
         
-        buckets = bucket_files_by_platform(files, pr_diff)
+        buckets = bucket_files_by_platform(files, _DIFF_RN_APP_VIEW)
         
         assert len(buckets["Android"]) == 1
         assert len(buckets["iOS"]) == 1
@@ -210,6 +248,21 @@ index 123..456 789
         assert len(buckets["React Native"]) == 1  # App.tsx
         assert len(buckets["Flutter"]) == 1
 
+    def test_bucket_uppercase_extension_keeps_path_case(self):
+        """Test that extensions match case-insensitively without altering paths."""
+        files = ["App/Screen.KT", "App/View.Swift"]
+
+        buckets = bucket_files_by_platform(files, "")
+
+        assert buckets["Android"] == ["App/Screen.KT"]
+        assert buckets["iOS"] == ["App/View.Swift"]
+
+    def test_bucket_no_files(self):
+        """Test that an empty file list yields empty buckets for every platform."""
+        buckets = bucket_files_by_platform([], "diff --git a/App.tsx b/App.tsx")
+
+        assert buckets == {platform: [] for platform in PLATFORM_ORDER}
+
 
 class TestPlatformOrder:
     """Tests for platform ordering."""
@@ -280,6 +333,18 @@ class TestLocationFiltering:
         assert ("file1.swift", 10) in filtered
         assert ("file3.swift", 30) in filtered
         assert ("file2.kt", 20) not in filtered
+
+    def test_filter_returns_original_entries(self):
+        """Test that filtered entries are the input objects, not copies."""
+        tuple_entry = ("file1.swift", 10, "Missing label")
+        dict_entry = {"path": "file1.swift", "line": 20}
+        locations = [tuple_entry, ("file2.kt", 20, "Other"), dict_entry]
+
+        filtered = filter_locations_for_files(locations, ["file1.swift"])
+
+        assert len(filtered) == 2
+        assert filtered[0] is tuple_entry
+        assert filtered[1] is dict_entry
     
     def test_filter_dict_locations_file_key(self):
         """Test filtering dict-based locations with 'file' key."""
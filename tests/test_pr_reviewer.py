@@ -4,26 +4,10 @@ Tests for PRReviewer
 Validates the review logic and existing_comments handling.
 """
 
-import pytest
-from unittest.mock import patch
-from app.pr_reviewer import PRReviewer
-
 
 class TestPRReviewerExistingComments:
     """Tests for existing_comments handling in _create_review_prompt."""
 
-    @pytest.fixture
-    def reviewer(self):
-        """Create a mock PRReviewer instance."""
-        # Mock the openai client to avoid actual API calls
-        with patch("app.pr_reviewer.openai.OpenAI"):
-            reviewer = PRReviewer(
-                scout_api_key="test-key",
-                scout_base_url="https://test.example.com",
-                scout_model="test-model",
-            )
-            return reviewer
-
     def test_create_prompt_with_2_tuple_existing_comments(self, reviewer):
         """Test that 2-tuple existing_comments work correctly."""
         pr_diff = "mock diff content"
@@ -71,14 +55,16 @@ class TestPRReviewerExistingComments:
         assert "file3.kt:30" in prompt
         # The third element (body snippet) should not appear as part of the location line
         # Verify format is "- file:line" not "- file:line:snippet"
-        lines = prompt.split("\n")
-        location_lines = [l for l in lines if l.startswith("- ") and ":" in l]
-        for loc_line in location_lines:
-            # Each location line should be "- path:line" format, not include extra data
-            parts = loc_line.replace("- ", "").split(":")
-            assert (
-                len(parts) == 2
-            ), f"Location line should be '- path:line' format: {loc_line}"
+        existing_section = prompt.split("# Existing Comments", 1)[1].split("\n# ", 1)[0]
+        location_lines = [
+            l.strip() for l in existing_section.split("\n") if l.strip().startswith("- ")
+        ]
+        assert location_lines == [
+            "- file1.swift:10",
+            "- file2.swift:25",
+            "- file3.kt:30",
+        ]
+        assert "Button missing label" not in prompt
         assert "Do NOT report issues at these locations" in prompt
 
     def test_create_prompt_with_dict_existing_comments(self, reviewer):
@@ -256,3 +242,17 @@ class TestPRReviewerExistingComments:
         assert "OtherView.swift:20" in prompt
         assert "# Existing Comments" in prompt
         assert "Do NOT report issues at these locations" in prompt
+
+    def test_existing_comment_locations_normalizes_entries(self, reviewer):
+        """Test that mixed entries normalize to hashable (file, line) pairs."""
+        existing_comments = [
+            ("file1.swift", 10, "anchor"),
+            {"path": "file2.swift", "line": 0},
+            {"file": "file3.swift"},
+            ("only_one",),
+            None,
+        ]
+
+        locations = reviewer._existing_comment_locations(existing_comments)
+
+        assert locations == (("file1.swift", "10"), ("file2.swift", "0"))
@@ -4,19 +4,78 @@ Tests for SARIF Generator
 Validates SARIF report generation from accessibility issues.
 """
 
+import os
 import pytest
 import json
-import tempfile
-from pathlib import Path
+from unittest.mock import patch
 from app.sarif_generator import SARIFGenerator, generate_and_write_sarif
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+# Minimal issue shared by tests that only vary one or two fields
+_ISSUE_TEMPLATE = {"file": "test.py", "line": 1, "wcag_sc": "1.1.1", "title": "Test"}
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """Shared SARIFGenerator instance."""
+    return SARIFGenerator()
+
+
+@pytest.fixture(scope="session")
+def sarif_single(generator):
+    """A single fully-populated issue and its generated SARIF report."""
+    issues = [
+        {
+            "file": "app/test.py",
+            "line": 42,
+            "severity": "major",
+            "wcag_sc": "1.1.1",
+            "wcag_level": "A",
+            "title": "Missing alt text",
+            "description": "Image lacks alternative text",
+            "impact": "Screen readers cannot describe image",
+            "suggested_fix": "Add alt attribute",
+        }
+    ]
+    return issues, generator.generate_sarif(issues)
+
+
+@pytest.fixture(scope="session")
+def sarif_multiple(generator):
+    """Two issues with different severities and their generated SARIF report."""
+    issues = [
+        {
+            "file": "app/page1.html",
+            "line": 10,
+            "severity": "critical",
+            "wcag_sc": "1.1.1",
+            "wcag_level": "A",
+            "title": "Missing alt text",
+            "description": "Critical issue",
+        },
+        {
+            "file": "app/page2.html",
+            "line": 20,
+            "severity": "minor",
+            "wcag_sc": "2.4.6",
+            "wcag_level": "AA",
+            "title": "Poor heading structure",
+            "description": "Minor issue",
+        },
+    ]
+    return issues, generator.generate_sarif(issues)
+
 
 class TestSARIFGenerator:
     """Tests for SARIFGenerator class."""
 
-    def test_generate_sarif_empty_issues(self):
+    def test_generate_sarif_empty_issues(self, generator):
         """Test generating SARIF with no issues."""
-        generator = SARIFGenerator()
         sarif = generator.generate_sarif([])
 
         assert sarif["version"] == "2.1.0"
@@ -25,24 +84,9 @@ class TestSARIFGenerator:
         # Should still have at least the generic rule
         assert len(sarif["runs"][0]["tool"]["driver"]["rules"]) >= 1
 
-    def test_generate_sarif_single_issue(self):
+    def test_generate_sarif_single_issue(self, sarif_single):
         """Test generating SARIF with single issue."""
-        issues = [
-            {
-                "file": "app/test.py",
-                "line": 42,
-                "severity": "major",
-                "wcag_sc": "1.1.1",
-                "wcag_level": "A",
-                "title": "Missing alt text",
-                "description": "Image lacks alternative text",
-                "impact": "Screen readers cannot describe image",
-                "suggested_fix": "Add alt attribute",
-            }
-        ]
-
-        generator = SARIFGenerator()
-        sarif = generator.generate_sarif(issues)
+        _, sarif = sarif_single
 
         # Check structure
         assert sarif["version"] == "2.1.0"
@@ -53,100 +97,88 @@ class TestSARIFGenerator:
         assert len(results) == 1
 
         result = results[0]
-        assert result["ruleId"] == "wcag-1-1-1"
-        assert result["level"] == "error"  # major -> error
-        assert result["message"]["text"]
+        # major -> error
+        assert (result["ruleId"], result["level"]) == ("wcag-1-1-1", "error")
         assert "Image lacks alternative text" in result["message"]["text"]
 
-        # Check location
-        location = result["locations"][0]["physicalLocation"]
-        assert location["artifactLocation"]["uri"] == "app/test.py"
-        assert location["region"]["startLine"] == 42
-
-        # Check properties
-        assert result["properties"]["severity"] == "major"
-        assert result["properties"]["wcag_sc"] == "1.1.1"
+    def test_generate_sarif_single_issue_location(self, sarif_single):
+        """Test location and properties of a single-issue SARIF result."""
+        issues, sarif = sarif_single
+        result = sarif["runs"][0]["results"][0]
 
-    def test_generate_sarif_multiple_issues(self):
+        location = result["locations"][0]["physicalLocation"]
+        assert (
+            location["artifactLocation"]["uri"],
+            location["region"]["startLine"],
+            result["properties"]["severity"],
+            result["properties"]["wcag_sc"],
+        ) == (issues[0]["file"], issues[0]["line"], "major", "1.1.1")
+
+    def test_generate_sarif_multiple_issues(self, sarif_multiple):
         """Test generating SARIF with multiple issues."""
-        issues = [
-            {
-                "file": "app/page1.html",
-                "line": 10,
-                "severity": "critical",
-                "wcag_sc": "1.1.1",
-                "wcag_level": "A",
-                "title": "Missing alt text",
-                "description": "Critical issue",
-            },
-            {
-                "file": "app/page2.html",
-                "line": 20,
-                "severity": "minor",
-                "wcag_sc": "2.4.6",
-                "wcag_level": "AA",
-                "title": "Poor heading structure",
-                "description": "Minor issue",
-            },
-        ]
-
-        generator = SARIFGenerator()
-        sarif = generator.generate_sarif(issues)
+        _, sarif = sarif_multiple
 
         results = sarif["runs"][0]["results"]
         assert len(results) == 2
 
-        # Check first result
-        assert results[0]["ruleId"] == "wcag-1-1-1"
-        assert results[0]["level"] == "error"  # critical -> error
+        # critical -> error, minor -> warning
+        assert [(r["ruleId"], r["level"]) for r in results] == [
+            ("wcag-1-1-1", "error"),
+            ("wcag-2-4-6", "warning"),
+        ]
 
-        # Check second result
-        assert results[1]["ruleId"] == "wcag-2-4-6"
-        assert results[1]["level"] == "warning"  # minor -> warning
+    def test_generate_sarif_multiple_issues_rules(self, sarif_multiple):
+        """Test that every result references a rule defined in the driver."""
+        _, sarif = sarif_multiple
+        run = sarif["runs"][0]
 
-    def test_severity_mapping(self):
-        """Test severity to SARIF level mapping."""
-        test_cases = [
+        rule_ids = [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+        assert rule_ids == ["wcag-1-1-1", "wcag-2-4-6", "accessibility-generic"]
+        assert {result["ruleId"] for result in run["results"]} <= set(rule_ids)
+
+    @pytest.mark.parametrize(
+        "severity, expected_level",
+        [
             ("critical", "error"),
             ("major", "error"),
             ("minor", "warning"),
             ("info", "note"),
-        ]
-
-        for severity, expected_level in test_cases:
-            issues = [
-                {
-                    "file": "test.py",
-                    "line": 1,
-                    "severity": severity,
-                    "wcag_sc": "1.1.1",
-                    "title": "Test",
-                }
-            ]
-
-            generator = SARIFGenerator()
-            sarif = generator.generate_sarif(issues)
-            result = sarif["runs"][0]["results"][0]
+        ],
+    )
+    def test_severity_mapping(self, generator, severity, expected_level):
+        """Test severity to SARIF level mapping."""
+        issues = [{**_ISSUE_TEMPLATE, "severity": severity}]
 
-            assert result["level"] == expected_level, f"Failed for severity {severity}"
+        sarif = generator.generate_sarif(issues)
+        result = sarif["runs"][0]["results"][0]
 
-    def test_make_rule_id_simple(self):
+        assert result["level"] == expected_level
+
+    @pytest.mark.parametrize(
+        "wcag_sc, expected",
+        [
+            ("1.1.1", "wcag-1-1-1"),
+            ("2.4.6", "wcag-2-4-6"),
+            ("3.3.2", "wcag-3-3-2"),
+        ],
+    )
+    def test_make_rule_id_simple(self, generator, wcag_sc, expected):
         """Test rule ID generation for simple WCAG SC."""
-        generator = SARIFGenerator()
-
-        assert generator._make_rule_id("1.1.1") == "wcag-1-1-1"
-        assert generator._make_rule_id("2.4.6") == "wcag-2-4-6"
-        assert generator._make_rule_id("3.3.2") == "wcag-3-3-2"
-
-    def test_make_rule_id_multiple_sc(self):
+        assert generator._make_rule_id(wcag_sc) == expected
+
+    @pytest.mark.parametrize(
+        "wcag_sc, expected",
+        [
+            ("1.1.1; 2.4.6", "wcag-1-1-1"),
+            ("3.3.2 ; 4.1.2", "wcag-3-3-2"),
+        ],
+    )
+    def test_make_rule_id_multiple_sc(self, generator, wcag_sc, expected):
         """Test rule ID generation for multiple WCAG SCs."""
-        generator = SARIFGenerator()
-
         # Should use first SC when multiple are present
-        assert generator._make_rule_id("1.1.1; 2.4.6") == "wcag-1-1-1"
-        assert generator._make_rule_id("3.3.2 ; 4.1.2") == "wcag-3-3-2"
+        assert generator._make_rule_id(wcag_sc) == expected
 
-    def test_generate_sarif_with_repo_info(self):
+    def test_generate_sarif_with_repo_info(self, generator):
         """Test generating SARIF with repository information."""
         issues = [
             {
@@ -158,7 +190,6 @@ class TestSARIFGenerator:
             }
         ]
 
-        generator = SARIFGenerator()
         sarif = generator.generate_sarif(
             issues,
             repo_uri="https://github.com/owner/repo",
@@ -171,15 +202,14 @@ class TestSARIFGenerator:
         assert provenance[0]["repositoryUri"] == "https://github.com/owner/repo"
         assert provenance[0]["revisionId"] == "abc123def"
 
-    def test_generate_rules_from_issues(self):
+    def test_generate_rules_from_issues(self, generator):
         """Test that rules are generated from unique WCAG SCs."""
         issues = [
-            {"file": "a.py", "line": 1, "wcag_sc": "1.1.1", "title": "Issue 1", "severity": "High"},
-            {"file": "b.py", "line": 2, "wcag_sc": "1.1.1", "title": "Issue 2", "severity": "Medium"},
-            {"file": "c.py", "line": 3, "wcag_sc": "2.4.6", "title": "Issue 3", "severity": "Low"},
+            {**_ISSUE_TEMPLATE, "file": "a.py", "severity": "High"},
+            {**_ISSUE_TEMPLATE, "file": "b.py", "severity": "Medium"},
+            {**_ISSUE_TEMPLATE, "file": "c.py", "wcag_sc": "2.4.6", "severity": "Low"},
         ]
 
-        generator = SARIFGenerator()
         sarif = generator.generate_sarif(issues)
 
         rules = sarif["runs"][0]["tool"]["driver"]["rules"]
@@ -190,7 +220,24 @@ class TestSARIFGenerator:
         assert "wcag-2-4-6" in rule_ids
         assert "accessibility-generic" in rule_ids
 
-    def test_issue_without_wcag_sc(self):
+    def test_generate_sarif_many_issues(self, generator):
+        """Test that a large scan yields one rule per unique WCAG SC."""
+        issues = [
+            {**_ISSUE_TEMPLATE, "wcag_sc": f"{i % 30}.{i % 10}.{i % 5}", "line": i}
+            for i in range(10_000)
+        ]
+
+        sarif = generator.generate_sarif(issues)
+
+        run = sarif["runs"][0]
+        rule_ids = [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+        assert len(run["results"]) == 10_000
+        # 30 distinct SCs plus the generic rule, with no duplicates
+        assert len(rule_ids) == 31
+        assert len(set(rule_ids)) == len(rule_ids)
+        assert {result["ruleId"] for result in run["results"]} < set(rule_ids)
+
+    def test_issue_without_wcag_sc(self, generator):
         """Test handling issues without WCAG SC."""
         issues = [
             {
@@ -203,61 +250,73 @@ class TestSARIFGenerator:
             }
         ]
 
-        generator = SARIFGenerator()
         sarif = generator.generate_sarif(issues)
 
         result = sarif["runs"][0]["results"][0]
         assert result["ruleId"] == "accessibility-generic"
 
-    def test_write_sarif_file(self):
+    def test_write_sarif_file(self, generator, tmp_path):
         """Test writing SARIF to file."""
-        issues = [
-            {
-                "file": "test.py",
-                "line": 1,
-                "severity": "Low",
-                "wcag_sc": "1.1.1",
-                "title": "Test",
-            }
-        ]
+        issues = [{**_ISSUE_TEMPLATE, "severity": "Low"}]
+
+        sarif = generator.generate_sarif(issues)
+
+        output_path = tmp_path / "test.sarif"
+        success = generator.write_sarif_file(sarif, str(output_path))
+
+        assert success is True
+
+        # Reading verifies the file exists and its content in one pass
+        loaded = json_loads(output_path.read_bytes())
+        assert loaded["version"] == "2.1.0"
+        assert len(loaded["runs"]) == 1
+
+    def test_write_sarif_file_without_orjson(self, generator, tmp_path):
+        """Test that the stdlib fallback writes the same report."""
+        issues = [{**_ISSUE_TEMPLATE, "severity": "Low"}]
 
-        generator = SARIFGenerator()
         sarif = generator.generate_sarif(issues)
 
-        # Write to temp file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.sarif"
+        output_path = tmp_path / "fallback.sarif"
+        with patch("app.sarif_generator.orjson", None):
             success = generator.write_sarif_file(sarif, str(output_path))
 
-            assert success is True
-            assert output_path.exists()
+        assert success is True
+        assert json_loads(output_path.read_bytes()) == sarif
+
+    def test_serialize_fallback_matches_orjson(self, generator):
+        """Test that the stdlib fallback writes the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        issues = [
+            {**_ISSUE_TEMPLATE, "severity": "Low", "title": "Étiquette manquante ✓"}
+        ]
+
+        sarif = generator.generate_sarif(issues)
 
-            # Verify content
-            with output_path.open() as f:
-                loaded = json.load(f)
-                assert loaded["version"] == "2.1.0"
-                assert len(loaded["runs"]) == 1
+        with patch("app.sarif_generator.orjson", None):
+            fallback = SARIFGenerator._serialize(sarif)
 
-    def test_write_sarif_file_creates_directories(self):
+        assert SARIFGenerator._serialize(sarif) == fallback
+        assert "Étiquette".encode("utf-8") in fallback
+
+    def test_write_sarif_file_creates_directories(self, generator, tmp_path):
         """Test that write_sarif_file creates parent directories."""
-        issues = [{"file": "test.py", "line": 1, "severity": "Low", "wcag_sc": "1.1.1", "title": "Test"}]
+        issues = [{**_ISSUE_TEMPLATE, "severity": "Low"}]
 
-        generator = SARIFGenerator()
         sarif = generator.generate_sarif(issues)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Use nested path
-            output_path = Path(tmpdir) / "subdir" / "nested" / "report.sarif"
-            success = generator.write_sarif_file(sarif, str(output_path))
+        # Use nested path
+        output_path = os.path.join(tmp_path, "subdir", "nested", "report.sarif")
+        success = generator.write_sarif_file(sarif, output_path)
 
-            assert success is True
-            assert output_path.exists()
+        assert success is True
+        assert os.path.isfile(output_path)
 
 
 class TestGenerateAndWriteSarif:
     """Tests for generate_and_write_sarif convenience function."""
 
-    def test_generate_and_write_sarif_complete_flow(self):
+    def test_generate_and_write_sarif_complete_flow(self, tmp_path):
         """Test complete flow of generating and writing SARIF."""
         issues = [
             {
@@ -271,9 +330,11 @@ class TestGenerateAndWriteSarif:
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "report.sarif"
+        output_path = tmp_path / "report.sarif"
 
+        with patch.object(
+            SARIFGenerator, "write_sarif_file", wraps=SARIFGenerator.write_sarif_file
+        ) as mock_write:
             success = generate_and_write_sarif(
                 issues,
                 str(output_path),
@@ -281,15 +342,20 @@ class TestGenerateAndWriteSarif:
                 repo_ref="main",
             )
 
-            assert success is True
-            assert output_path.exists()
+        assert success is True
+        assert output_path.stat().st_size > 0
 
-            # Verify content
-            with output_path.open() as f:
-                sarif = json.load(f)
-                assert sarif["version"] == "2.1.0"
-                assert len(sarif["runs"][0]["results"]) == 1
-                assert sarif["runs"][0]["versionControlProvenance"][0]["repositoryUri"] == "https://github.com/test/repo"
+        # Assert on the report that was written rather than re-parsing the
+        # file; serialization itself is covered by test_write_sarif_file
+        sarif, written_path = mock_write.call_args.args
+        assert written_path == str(output_path)
+        assert sarif["version"] == "2.1.0"
+        run = sarif["runs"][0]
+        assert len(run["results"]) == 1
+        assert (
+            run["versionControlProvenance"][0]["repositoryUri"]
+            == "https://github.com/test/repo"
+        )
 
 
 if __name__ == "__main__":
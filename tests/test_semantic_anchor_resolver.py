@@ -5,7 +5,12 @@ Validates semantic anchor resolution across multiple UI frameworks.
 """
 
 import pytest
-from app.semantic_anchor_resolver import SemanticAnchorResolver
+from unittest.mock import patch
+from app.semantic_anchor_resolver import (
+    SemanticAnchorResolver,
+    _compile_anchor_pattern,
+    _pick_nearest,
+)
 from app.diff_parser import DiffParser
 
 
@@ -149,6 +154,33 @@ index bbbbbbb..ccccccc 100644
 """
 
 
+def _parse_diff(diff_text):
+    """Parse a diff through the public two-step extraction API."""
+    commentable_lines = DiffParser.extract_commentable_lines(diff_text)
+    line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
+        diff_text, commentable_lines
+    )
+    return commentable_lines, line_texts
+
+
+@pytest.fixture(scope="module")
+def parsed_diffs():
+    """Commentable lines and line texts for each shared diff, parsed once."""
+    return {
+        diff_text: _parse_diff(diff_text)
+        for diff_text in (
+            COMPOSE_SLIDER_DIFF,
+            ANDROID_XML_SEEKBAR_DIFF,
+            SWIFTUI_SLIDER_DIFF,
+            SWIFTUI_TOGGLE_DIFF,
+            UIKIT_SLIDER_DIFF,
+            REACT_BUTTON_DIFF,
+            REACT_INPUT_DIFF,
+            HTML_IMG_DIFF,
+        )
+    }
+
+
 class TestSemanticAnchorResolver:
     """Tests for SemanticAnchorResolver class."""
 
@@ -171,6 +203,16 @@ class TestSemanticAnchorResolver:
                 break
         assert slider_found
 
+    def test_parse_diff_matches_two_step_extraction(self):
+        """Test that parse_diff returns the same data as the two-step parse."""
+        parsed = SemanticAnchorResolver.parse_diff(COMPOSE_SLIDER_DIFF)
+
+        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
+        assert parsed.commentable == commentable_lines
+        assert parsed.texts == SemanticAnchorResolver.extract_commentable_line_texts(
+            COMPOSE_SLIDER_DIFF, commentable_lines
+        )
+
     def test_extract_anchor_candidates_slider(self):
         """Test extracting anchor candidates for slider issue."""
         issue = {
@@ -184,7 +226,7 @@ class TestSemanticAnchorResolver:
         # Should extract 'slider' keyword and generate patterns
         assert len(candidates) > 0
         # Check that slider patterns are included
-        assert any('Slider' in str(c) for c in candidates)
+        assert any('Slider' in c for c in candidates)
 
     def test_extract_anchor_candidates_button(self):
         """Test extracting anchor candidates for button issue."""
@@ -197,7 +239,7 @@ class TestSemanticAnchorResolver:
         candidates = SemanticAnchorResolver.extract_anchor_candidates(issue)
 
         assert len(candidates) > 0
-        assert any('button' in str(c).lower() for c in candidates)
+        assert any('button' in c.lower() for c in candidates)
 
     def test_extract_anchor_candidates_with_explicit_anchor(self):
         """Test that explicit anchor_text field takes priority."""
@@ -212,13 +254,10 @@ class TestSemanticAnchorResolver:
         # Explicit anchor should be first
         assert 'CustomComponent(' in candidates
 
-    def test_resolve_compose_slider_issue(self):
+    def test_resolve_compose_slider_issue(self, parsed_diffs):
         """Test resolving Compose slider issue to correct line."""
         # Parse diff
-        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            COMPOSE_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
 
         file_path = "app/src/main/java/com/example/Settings.kt"
 
@@ -243,12 +282,9 @@ class TestSemanticAnchorResolver:
         assert resolved_line is not None
         assert 'Slider(' in line_texts[file_path][resolved_line]
 
-    def test_resolve_android_xml_seekbar_issue(self):
+    def test_resolve_android_xml_seekbar_issue(self, parsed_diffs):
         """Test resolving Android XML SeekBar issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(ANDROID_XML_SEEKBAR_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            ANDROID_XML_SEEKBAR_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[ANDROID_XML_SEEKBAR_DIFF]
 
         file_path = "app/src/main/res/layout/activity_settings.xml"
 
@@ -274,12 +310,9 @@ class TestSemanticAnchorResolver:
         line_content = line_texts[file_path][resolved_line]
         assert 'SeekBar' in line_content or 'contentDescription' in line_content
 
-    def test_resolve_swiftui_slider_issue(self):
+    def test_resolve_swiftui_slider_issue(self, parsed_diffs):
         """Test resolving SwiftUI Slider issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(SWIFTUI_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            SWIFTUI_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[SWIFTUI_SLIDER_DIFF]
 
         file_path = "SettingsView.swift"
 
@@ -302,12 +335,9 @@ class TestSemanticAnchorResolver:
         assert resolved_line is not None
         assert 'Slider(' in line_texts[file_path][resolved_line]
 
-    def test_resolve_swiftui_toggle_issue(self):
+    def test_resolve_swiftui_toggle_issue(self, parsed_diffs):
         """Test resolving SwiftUI Toggle issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(SWIFTUI_TOGGLE_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            SWIFTUI_TOGGLE_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[SWIFTUI_TOGGLE_DIFF]
 
         file_path = "SettingsView.swift"
 
@@ -330,12 +360,9 @@ class TestSemanticAnchorResolver:
         assert resolved_line is not None
         assert 'Toggle(' in line_texts[file_path][resolved_line]
 
-    def test_resolve_uikit_slider_issue(self):
+    def test_resolve_uikit_slider_issue(self, parsed_diffs):
         """Test resolving UIKit UISlider issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(UIKIT_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            UIKIT_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[UIKIT_SLIDER_DIFF]
 
         file_path = "SettingsViewController.swift"
 
@@ -359,12 +386,9 @@ class TestSemanticAnchorResolver:
         line_content = line_texts[file_path][resolved_line]
         assert 'UISlider' in line_content or 'accessibilityLabel' in line_content
 
-    def test_resolve_react_button_issue(self):
+    def test_resolve_react_button_issue(self, parsed_diffs):
         """Test resolving React button issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(REACT_BUTTON_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            REACT_BUTTON_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[REACT_BUTTON_DIFF]
 
         file_path = "src/components/Settings.tsx"
 
@@ -387,12 +411,9 @@ class TestSemanticAnchorResolver:
         assert resolved_line is not None
         assert '<button' in line_texts[file_path][resolved_line]
 
-    def test_resolve_react_input_aria_label_issue(self):
+    def test_resolve_react_input_aria_label_issue(self, parsed_diffs):
         """Test resolving React input with aria-label issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(REACT_INPUT_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            REACT_INPUT_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[REACT_INPUT_DIFF]
 
         file_path = "src/components/Form.tsx"
 
@@ -416,12 +437,9 @@ class TestSemanticAnchorResolver:
         line_content = line_texts[file_path][resolved_line]
         assert '<input' in line_content or 'aria-label' in line_content
 
-    def test_resolve_html_img_alt_issue(self):
+    def test_resolve_html_img_alt_issue(self, parsed_diffs):
         """Test resolving HTML image alt text issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(HTML_IMG_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            HTML_IMG_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[HTML_IMG_DIFF]
 
         file_path = "index.html"
 
@@ -444,12 +462,9 @@ class TestSemanticAnchorResolver:
         assert resolved_line is not None
         assert '<img' in line_texts[file_path][resolved_line]
 
-    def test_resolve_no_anchor_found_returns_none(self):
+    def test_resolve_no_anchor_found_returns_none(self, parsed_diffs):
         """Test that resolver returns None when no anchor found."""
-        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            COMPOSE_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
 
         file_path = "app/src/main/java/com/example/Settings.kt"
 
@@ -473,12 +488,9 @@ class TestSemanticAnchorResolver:
         # Should return None (fall back to nearest line logic)
         assert resolved_line is None
 
-    def test_resolve_respects_max_distance(self):
+    def test_resolve_respects_max_distance(self, parsed_diffs):
         """Test that resolver respects max_distance parameter."""
-        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            COMPOSE_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
 
         file_path = "app/src/main/java/com/example/Settings.kt"
 
@@ -503,27 +515,53 @@ class TestSemanticAnchorResolver:
         # (actual result depends on diff structure)
         # This tests the max_distance logic is being applied
 
+    def test_resolve_issue_line_backreference_anchor(self):
+        """Test that anchors with backreferences bypass the combined prefilter."""
+        line_texts = {10: '        Text("Volume")', 11: '        <b>Volume</b>'}
+        issue = {'line': 10, 'title': 'Missing label', 'anchor_text': r'<(\w+)>\s*Volume</\1>'}
+
+        resolved_line = SemanticAnchorResolver.resolve_issue_line(
+            issue, 'Settings.html', [10, 11], line_texts
+        )
+
+        assert resolved_line == 11
+
+    def test_resolve_issue_line_nearest_first(self):
+        """Test that the nearest match wins, the earlier line on equal distance."""
+        line_texts = {4: 'Slider(', 8: 'Text("a")', 12: 'Slider(', 13: 'Slider('}
+        issue = {'line': 8, 'title': 'Slider missing label'}
+
+        # 4 and 12 are equidistant from 8; line order in the input is irrelevant
+        assert SemanticAnchorResolver.resolve_issue_line(
+            issue, 'Settings.kt', [13, 12, 8, 4], line_texts
+        ) == 4
+        assert SemanticAnchorResolver.resolve_issue_line(
+            issue, 'Settings.kt', [8, 12, 13], line_texts, max_distance=3
+        ) is None
+
     def test_get_all_framework_patterns(self):
         """Test that all framework patterns are returned."""
         patterns = SemanticAnchorResolver.get_all_framework_patterns()
 
         assert len(patterns) > 0
         # Check that patterns from different frameworks are included
-        assert any('Slider' in p for p in patterns)
-        assert any('Button' in p for p in patterns)
-        assert any('contentDescription' in p for p in patterns)
-        assert any('accessibilityLabel' in p for p in patterns)
+        joined = '\n'.join(patterns)
+        for name in ('Slider', 'Button', 'contentDescription', 'accessibilityLabel'):
+            assert name in joined
+
+        # Callers get their own list; the shared table is not mutated
+        patterns.clear()
+        assert SemanticAnchorResolver.get_all_framework_patterns() == list(
+            SemanticAnchorResolver.ALL_FRAMEWORK_PATTERNS
+        )
 
 
 class TestResolveAnchorLine:
     """Tests for the new deterministic resolve_anchor_line function."""
 
-    def test_resolve_with_explicit_anchor_text_compose(self):
+    def test_resolve_with_explicit_anchor_text_compose(self, parsed_diffs):
         """Test resolving with explicit anchor_text field - Compose Slider."""
-        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            COMPOSE_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
 
         file_path = "app/src/main/java/com/example/Settings.kt"
         right_line_to_text = line_texts[file_path]
@@ -548,12 +586,9 @@ class TestResolveAnchorLine:
         assert resolved_line is not None
         assert 'Slider(' in matched_text
 
-    def test_resolve_with_inferred_anchor_swiftui_toggle(self):
+    def test_resolve_with_inferred_anchor_swiftui_toggle(self, parsed_diffs):
         """Test resolving with inferred anchor - SwiftUI Toggle."""
-        commentable_lines = DiffParser.extract_commentable_lines(SWIFTUI_TOGGLE_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            SWIFTUI_TOGGLE_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[SWIFTUI_TOGGLE_DIFF]
 
         file_path = "SettingsView.swift"
         right_line_to_text = line_texts[file_path]
@@ -579,12 +614,9 @@ class TestResolveAnchorLine:
         assert resolved_line is not None
         assert 'Toggle(' in matched_text
 
-    def test_resolve_android_xml_content_description(self):
+    def test_resolve_android_xml_content_description(self, parsed_diffs):
         """Test resolving Android XML contentDescription issue."""
-        commentable_lines = DiffParser.extract_commentable_lines(ANDROID_XML_SEEKBAR_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            ANDROID_XML_SEEKBAR_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[ANDROID_XML_SEEKBAR_DIFF]
 
         file_path = "app/src/main/res/layout/activity_settings.xml"
         right_line_to_text = line_texts[file_path]
@@ -627,10 +659,7 @@ index 1111111..2222222 100644
    );
  };
 """
-        commentable_lines = DiffParser.extract_commentable_lines(web_diff)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            web_diff, commentable_lines
-        )
+        commentable_lines, line_texts = _parse_diff(web_diff)
 
         file_path = "src/components/Slider.tsx"
         right_line_to_text = line_texts[file_path]
@@ -676,10 +705,7 @@ index aaaaaaa..bbbbbbb 100644
      }
  }
 """
-        commentable_lines = DiffParser.extract_commentable_lines(multi_button_diff)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            multi_button_diff, commentable_lines
-        )
+        commentable_lines, line_texts = _parse_diff(multi_button_diff)
 
         file_path = "ButtonScreen.kt"
         right_line_to_text = line_texts[file_path]
@@ -706,13 +732,70 @@ index aaaaaaa..bbbbbbb 100644
         # The second Button should be closer to line 18
         assert resolved_line >= 16  # Should be second Button, not first
 
-    def test_resolve_no_match_returns_none(self):
-        """Test that resolver returns None when no anchor match found."""
-        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            COMPOSE_SLIDER_DIFF, commentable_lines
+    def test_resolve_closest_match_ties_and_unordered_lines(self):
+        """Test closest-match selection on equidistant and unordered lines."""
+        issue = {'line': 20, 'title': 'Missing label', 'anchor_text': 'Slider('}
+
+        # Equidistant matches resolve to the earlier line
+        right_line_to_text = {10: 'Slider(', 15: 'Text("a")', 30: 'Slider('}
+        assert SemanticAnchorResolver.resolve_anchor_line(
+            issue, right_line_to_text
+        ) == (10, 'Slider(')
+
+        # Mapping order does not affect which line is closest
+        right_line_to_text = {40: 'Slider(', 22: 'Slider(', 5: 'Slider('}
+        assert SemanticAnchorResolver.resolve_anchor_line(
+            issue, right_line_to_text
+        ) == (22, 'Slider(')
+
+    def test_resolve_anchor_lines_matches_single_issue_resolution(self):
+        """Test that batch resolution gives the same result as resolving each issue."""
+        right_line_to_text = {
+            10: '        Text("Volume")',
+            11: '        Slider(',
+            12: '            value = volume,',
+            20: '        Button(onClick = { save() })',
+            30: '        Slider(',
+        }
+        issues = [
+            {'line': 12, 'title': 'Slider missing label'},
+            {'line': 28, 'title': 'Slider missing label'},
+            {'line': 18, 'title': 'Button needs accessible name'},
+            {'line': 25, 'title': 'Missing label', 'anchor_text': 'text('},
+            {'line': 25, 'title': 'Missing label', 'current_code': 'Button(onClick = { save() })'},
+            {'line': 10, 'title': 'Generic issue', 'anchor_text': 'NonExistentElement('},
+        ]
+
+        results = SemanticAnchorResolver.resolve_anchor_lines(
+            issues, right_line_to_text, file_extension='.kt'
         )
 
+        assert results == [
+            SemanticAnchorResolver.resolve_anchor_line(
+                issue, right_line_to_text, file_extension='.kt'
+            )
+            for issue in issues
+        ]
+        assert [line for line, _ in results] == [11, 30, 20, 10, 20, None]
+
+    def test_resolve_anchor_lines_without_line_texts(self):
+        """Test that batch resolution returns no match per issue without line texts."""
+        issues = [{'line': 10, 'title': 'Slider missing label'}] * 2
+
+        assert SemanticAnchorResolver.resolve_anchor_lines(issues, {}) == [(None, None)] * 2
+
+    @pytest.mark.parametrize(
+        'reference_line, expected_index',
+        [(1, 0), (10, 0), (14, 0), (15, 0), (16, 1), (25, 1), (99, 2)],
+    )
+    def test_pick_nearest(self, reference_line, expected_index):
+        """Test nearest-line selection, including ties and out-of-range references."""
+        assert _pick_nearest([10, 20, 40], reference_line) == expected_index
+
+    def test_resolve_no_match_returns_none(self, parsed_diffs):
+        """Test that resolver returns None when no anchor match found."""
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
+
         file_path = "app/src/main/java/com/example/Settings.kt"
         right_line_to_text = line_texts[file_path]
 
@@ -736,12 +819,9 @@ index aaaaaaa..bbbbbbb 100644
         assert resolved_line is None
         assert matched_text is None
 
-    def test_resolve_case_insensitive_matching(self):
+    def test_resolve_case_insensitive_matching(self, parsed_diffs):
         """Test that anchor matching works case-insensitively for keywords."""
-        commentable_lines = DiffParser.extract_commentable_lines(COMPOSE_SLIDER_DIFF)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            COMPOSE_SLIDER_DIFF, commentable_lines
-        )
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
 
         file_path = "app/src/main/java/com/example/Settings.kt"
         right_line_to_text = line_texts[file_path]
@@ -766,6 +846,57 @@ index aaaaaaa..bbbbbbb 100644
         assert resolved_line is not None
         assert 'Slider' in matched_text
 
+    def test_resolve_compiles_candidate_patterns_once(self, parsed_diffs):
+        """Test that candidate regexes are compiled once and reused across calls."""
+        commentable_lines, line_texts = parsed_diffs[COMPOSE_SLIDER_DIFF]
+        right_line_to_text = line_texts["app/src/main/java/com/example/Settings.kt"]
+        issue = {'line': 13, 'title': 'Slider missing accessibility label'}
+
+        first = SemanticAnchorResolver.resolve_anchor_line(
+            issue, right_line_to_text, file_extension='.kt'
+        )
+        misses = _compile_anchor_pattern.cache_info().misses
+        second = SemanticAnchorResolver.resolve_anchor_line(
+            issue, right_line_to_text, file_extension='.kt'
+        )
+
+        assert second == first
+        assert _compile_anchor_pattern.cache_info().misses == misses
+
+    def test_resolve_literal_anchor_compiles_nothing(self):
+        """Test that a lone literal anchor_text is matched without any regex."""
+        right_line_to_text = {10: '        Text("Volume")', 11: '        Slider('}
+        issue = {'line': 10, 'title': 'Missing label', 'anchor_text': 'slider('}
+
+        before = _compile_anchor_pattern.cache_info()
+        resolved = SemanticAnchorResolver.resolve_anchor_line(issue, right_line_to_text)
+        after = _compile_anchor_pattern.cache_info()
+
+        assert resolved == (11, 'Slider(')
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
+    def test_resolve_skips_invalid_regex_candidate(self):
+        """Test that an invalid regex anchor is skipped instead of raising."""
+        right_line_to_text = {10: '        Slider(', 11: '            value = volume,'}
+        issue = {'line': 10, 'title': 'Missing label', 'anchor_text': 'Slider(['}
+
+        resolved_line, matched_text = SemanticAnchorResolver.resolve_anchor_line(
+            issue, right_line_to_text
+        )
+
+        assert (resolved_line, matched_text) == (None, None)
+
+    def test_resolve_grouped_regex_anchor(self):
+        """Test that anchors with regex groups still resolve."""
+        right_line_to_text = {10: '        Text("Volume")', 11: '        Slider('}
+        issue = {'line': 10, 'title': 'Missing label', 'anchor_text': r'(Slider)\s*\('}
+
+        resolved_line, matched_text = SemanticAnchorResolver.resolve_anchor_line(
+            issue, right_line_to_text
+        )
+
+        assert (resolved_line, matched_text) == (11, 'Slider(')
+
     def test_extract_anchor_candidates_with_file_extension(self):
         """Test that file extension influences anchor candidate extraction."""
         issue = {
@@ -775,15 +906,27 @@ index aaaaaaa..bbbbbbb 100644
 
         # Kotlin extension should add Compose patterns
         candidates_kt = SemanticAnchorResolver.extract_anchor_candidates(issue, '.kt')
-        assert any(r'\bSlider\s*\(' in str(c) for c in candidates_kt)
+        assert r'\bSlider\s*\(' in candidates_kt
 
         # Swift extension should add SwiftUI patterns
         candidates_swift = SemanticAnchorResolver.extract_anchor_candidates(issue, '.swift')
-        assert any('accessibilityLabel' in str(c) for c in candidates_swift)
+        assert any('accessibilityLabel' in c for c in candidates_swift)
 
         # XML extension should add Android XML patterns
         candidates_xml = SemanticAnchorResolver.extract_anchor_candidates(issue, '.xml')
-        assert any('contentDescription' in str(c) for c in candidates_xml)
+        assert any('contentDescription' in c for c in candidates_xml)
+
+    def test_extract_anchor_candidates_extension_lookup(self):
+        """Test that extension patterns are case-insensitive and unknown extensions add none."""
+        issue = {'title': 'Generic title', 'description': 'Generic description'}
+
+        candidates_upper = SemanticAnchorResolver.extract_anchor_candidates(issue, '.SWIFT')
+        candidates_unknown = SemanticAnchorResolver.extract_anchor_candidates(issue, '.py')
+
+        assert candidates_upper == (
+            SemanticAnchorResolver.SWIFTUI_PATTERNS + SemanticAnchorResolver.UIKIT_PATTERNS
+        )
+        assert candidates_unknown == []
 
 
 class TestCallSitePrioritization:
@@ -819,10 +962,7 @@ index 1234567..abcdefg 100644
      }
  }
 """
-        commentable_lines = DiffParser.extract_commentable_lines(compose_diff)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            compose_diff, commentable_lines
-        )
+        commentable_lines, line_texts = _parse_diff(compose_diff)
         
         file_path = "app/src/main/java/com/example/LoginScreen.kt"
         right_line_to_text = line_texts[file_path]
@@ -882,10 +1022,7 @@ index 1111111..2222222 100644
      }
  }
 """
-        commentable_lines = DiffParser.extract_commentable_lines(swiftui_diff)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            swiftui_diff, commentable_lines
-        )
+        commentable_lines, line_texts = _parse_diff(swiftui_diff)
         
         file_path = "LoginView.swift"
         right_line_to_text = line_texts[file_path]
@@ -935,10 +1072,7 @@ index aaaaaaa..bbbbbbb 100644
      }
  }
 """
-        commentable_lines = DiffParser.extract_commentable_lines(compose_diff)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            compose_diff, commentable_lines
-        )
+        commentable_lines, line_texts = _parse_diff(compose_diff)
         
         file_path = "FormScreen.kt"
         right_line_to_text = line_texts[file_path]
@@ -967,6 +1101,43 @@ index aaaaaaa..bbbbbbb 100644
         assert 'OutlinedTextField(' in matched_text
         assert resolved_line == 11  # OutlinedTextField line, not modifier line
 
+    def test_call_site_match_skips_inferred_candidates(self):
+        """Test that a matching call-site token resolves without inferring candidates."""
+        right_line_to_text = {10: '        Button(', 20: '        TextField(', 30: '        TextField('}
+        issue = {
+            'line': 24,
+            'title': 'Button label missing',
+            'current_code': 'TextField(value = email)',
+        }
+
+        with patch.object(SemanticAnchorResolver, 'extract_anchor_candidates') as mock_extract:
+            resolved = SemanticAnchorResolver.resolve_anchor_line(
+                issue, right_line_to_text, file_extension='.kt'
+            )
+
+        mock_extract.assert_not_called()
+        assert resolved == (20, 'TextField(')
+
+    def test_call_site_token_extracted_once_on_miss(self):
+        """Test that current_code is parsed once when the call-site token matches no line."""
+        right_line_to_text = {10: '        Button(', 20: '        Text("Save")'}
+        issue = {
+            'line': 12,
+            'title': 'Button label missing',
+            'current_code': 'Slider(value = 0.5f)',
+        }
+
+        with patch.object(
+            SemanticAnchorResolver, 'extract_call_site_token',
+            wraps=SemanticAnchorResolver.extract_call_site_token,
+        ) as mock_token:
+            resolved = SemanticAnchorResolver.resolve_anchor_line(
+                issue, right_line_to_text, file_extension='.kt'
+            )
+
+        mock_token.assert_called_once_with('Slider(value = 0.5f)')
+        assert resolved == (10, 'Button(')
+
     def test_call_site_extraction_from_current_code(self):
         """Test that extract_call_site_token correctly extracts UI element tokens."""
         # Compose/Kotlin
@@ -1009,10 +1180,7 @@ index 3333333..4444444 100644
      }
  }
 """
-        commentable_lines = DiffParser.extract_commentable_lines(swiftui_diff)
-        line_texts = SemanticAnchorResolver.extract_commentable_line_texts(
-            swiftui_diff, commentable_lines
-        )
+        commentable_lines, line_texts = _parse_diff(swiftui_diff)
         
         file_path = "SettingsView.swift"
         right_line_to_text = line_texts[file_path]
@@ -1,11 +1,18 @@
 """
 Tests for webhook_server functions
 
-Validates posted_locations unpacking in is_near_existing_comment.
+Validates posted_locations indexing for is_near_existing_comment.
 Tests refined deduplication logic that uses issue identity (title/anchor signature).
 """
 
 import logging
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from app.webhook_server import PostedLocation, index_posted_locations
+from app.webhook_server import is_near_existing_comment as _is_near
 
 # Set up logging for tests
 logging.basicConfig(level=logging.DEBUG)
@@ -13,294 +20,132 @@ logging.basicConfig(level=logging.DEBUG)
 
 def _create_is_near_existing_comment_function(posted_locations):
     """
-    Helper function to create an is_near_existing_comment function with the given posted_locations.
-    This matches the refined implementation in app/webhook_server.py.
-    """
-    # Mock logger for tests
-    class MockLogger:
-        def debug(self, msg):
-            pass
-    
-    logger = MockLogger()
+    Bind app.webhook_server.is_near_existing_comment to the given posted_locations.
 
-    def is_near_existing_comment(
-        file_path: str, 
-        line: int, 
-        issue: dict = None,
-        range_threshold: int = 5
-    ) -> tuple:
-        """
-        Check if a location is near any existing comment AND if it's the same issue.
-        
-        Returns:
-            Tuple of (should_skip: bool, skip_reason: str, matched_entry: dict or None)
-        """
-        # Extract issue identity for matching
-        issue_title = ""
-        issue_anchor = ""
-        if issue:
-            issue_title = str(issue.get("title", "")).strip()[:50].lower()
-            # Get anchor signature
-            if issue.get("_anchor_matched_text"):
-                issue_anchor = str(issue.get("_anchor_matched_text", "")).strip().lower()
-            elif issue.get("anchor_text"):
-                issue_anchor = str(issue.get("anchor_text", "")).strip().lower()
-        
-        for entry in posted_locations:
-            try:
-                # Parse entry based on type
-                existing_file = None
-                existing_line = None
-                existing_snippet = ""
-                
-                # Handle dictionary entries
-                if isinstance(entry, dict):
-                    existing_file = entry.get("file") or entry.get("path")
-                    existing_line = entry.get("line")
-                    existing_snippet = entry.get("snippet", "")
-                    if not existing_file or not existing_line:
-                        continue
-                # Handle tuple/list entries with 2+ values
-                elif isinstance(entry, (tuple, list)) and len(entry) >= 2:
-                    existing_file = entry[0]
-                    existing_line = entry[1]
-                    # Extract body snippet if available (3rd element)
-                    if len(entry) >= 3:
-                        existing_snippet = str(entry[2]) if entry[2] else ""
-                else:
-                    # Skip malformed entries
-                    continue
-
-                # Check if same file
-                if existing_file != file_path:
-                    continue
-                
-                # Calculate distance
-                distance = abs(existing_line - line)
-                
-                # Check if within range
-                if distance > range_threshold:
-                    continue
-                
-                # Within range - now check if it's the SAME issue
-                is_same_issue = False
-                match_reason = ""
-                
-                # If we have issue metadata, check for identity match
-                if issue and (issue_title or issue_anchor):
-                    # Normalize existing snippet for comparison
-                    existing_title = existing_snippet.strip()[:50].lower()
-                    
-                    # Check title match
-                    if issue_title and existing_title:
-                        # Fuzzy match: check if titles are similar enough
-                        if issue_title == existing_title:
-                            is_same_issue = True
-                            match_reason = "exact title match"
-                        elif len(issue_title) >= 30 and len(existing_title) >= 30:
-                            # For longer titles, check prefix match
-                            min_len = min(len(issue_title), len(existing_title))
-                            threshold = int(min_len * 0.8)
-                            if issue_title[:threshold] == existing_title[:threshold]:
-                                is_same_issue = True
-                                match_reason = "fuzzy title match"
-                    
-                    # Check anchor match (if title didn't match)
-                    if not is_same_issue and issue_anchor and existing_snippet:
-                        # Check if anchor text appears in existing snippet
-                        # Normalize both for comparison
-                        anchor_normalized = "".join(issue_anchor.split()).lower()[:40]
-                        snippet_normalized = "".join(existing_snippet.split()).lower()
-                        
-                        # Try substring match
-                        if anchor_normalized and len(anchor_normalized) >= 3:
-                            if anchor_normalized in snippet_normalized:
-                                is_same_issue = True
-                                match_reason = "anchor signature match"
-                        
-                        # Also try matching just the keyword (before parenthesis or special chars)
-                        if not is_same_issue and anchor_normalized:
-                            # Extract keyword: take alphanumeric part before special chars
-                            import re
-                            keyword_match = re.match(r'^([a-z0-9_]+)', anchor_normalized)
-                            if keyword_match:
-                                keyword = keyword_match.group(1)
-                                if len(keyword) >= 4 and keyword in snippet_normalized:
-                                    is_same_issue = True
-                                    match_reason = "anchor signature match"
-                
-                # If same issue detected, skip it
-                if is_same_issue:
-                    matched_entry = {
-                        "file": existing_file,
-                        "line": existing_line,
-                        "distance": distance,
-                        "snippet": existing_snippet[:100],
-                    }
-                    return (True, match_reason, matched_entry)
-                
-                # Within range but NOT same issue - this is likely a corrected anchor
-                logger.debug(
-                    f"Location {file_path}:{line} is near {existing_file}:{existing_line} "
-                    f"(distance={distance}) but appears to be a different issue. Not suppressing."
-                )
-                
-            except (TypeError, ValueError, IndexError, AttributeError):
-                # Skip malformed entries safely
-                continue
-        
-        # No matching existing comment found
-        return (False, "", None)
-
-    return is_near_existing_comment
+    The location index is built once up front, as post_batch_comments does.
+    """
+    return partial(_is_near, index_posted_locations(posted_locations))
 
 
 class TestIsNearExistingComment:
     """Tests for is_near_existing_comment function."""
 
-    def test_with_2_tuples(self):
-        """Test that 2-tuples work (backward compatibility) - no issue metadata."""
-        posted_locations = {
-            ("app/main.py", 10),
-            ("app/utils.py", 25),
-        }
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # Without issue metadata, proximity alone doesn't suppress (returns False)
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10)
-        assert should_skip is False
-        
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 12)
-        assert should_skip is False
-        
-        # Test outside range
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 20)
-        assert should_skip is False
-        
-        # Test different file
-        should_skip, reason, matched = is_near_existing_comment("app/other.py", 10)
-        assert should_skip is False
-
-    def test_with_3_tuples(self):
-        """Test that 3-tuples work (current format with body_snippet)."""
-        posted_locations = {
-            ("app/main.py", 10, "Missing alt text"),
-            ("app/utils.py", 25, "No ARIA label"),
-        }
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # Without issue metadata, no suppression
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10)
-        assert should_skip is False
-        
-        # With matching issue
-        issue = {"title": "Missing alt text", "file": "app/main.py", "line": 10}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is True
-        assert reason == "exact title match"
-        assert matched is not None
-        assert matched["line"] == 10
-        
-        # With different issue at nearby location
-        different_issue = {"title": "Different issue", "file": "app/main.py", "line": 8}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 8, different_issue)
-        assert should_skip is False  # Should NOT suppress different issue
-
-    def test_with_4_tuples(self):
-        """Test that 4+ tuples work (extended format)."""
-        posted_locations = {
-            ("app/main.py", 10, "Missing alt text", "extra_data"),
-        }
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # With matching issue
-        issue = {"title": "Missing alt text"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is True
-        assert reason == "exact title match"
-
-    def test_with_dict_file_key(self):
-        """Test that dictionaries with 'file' key work."""
-        posted_locations = [
-            {"file": "app/main.py", "line": 10, "snippet": "Button missing label"},
-        ]
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # With matching issue
-        issue = {"title": "Button missing label"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is True
-
-    def test_with_dict_path_key(self):
-        """Test that dictionaries with 'path' key work."""
-        posted_locations = [
-            {"path": "app/main.py", "line": 10, "snippet": "Icon without alt"},
-        ]
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # With matching issue
-        issue = {"title": "Icon without alt"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is True
-
-    def test_with_mixed_formats(self):
-        """Test that mixed formats work together."""
-        posted_locations = [
-            ("app/main.py", 10),
-            ("app/utils.py", 25, "No ARIA label"),
-            ("app/helpers.py", 50, "Missing alt", "extra"),
-            ["app/models.py", 15],
-        ]
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # Test with issue metadata
-        issue = {"title": "No ARIA label"}
-        should_skip, reason, matched = is_near_existing_comment("app/utils.py", 23, issue)
-        assert should_skip is True
-        assert reason == "exact title match"
-
-    def test_with_malformed_entries(self):
-        """Test that malformed entries are skipped safely."""
-        posted_locations = [
-            ("app/main.py", 10, "Issue title"),  # Valid
-            ("single_value",),  # Malformed: only 1 value
-            (),  # Malformed: empty tuple
-            "not_a_tuple",  # Malformed: string
-            123,  # Malformed: number
-            None,  # Malformed: None
-        ]
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # Should still find valid entry with matching issue
-        issue = {"title": "Issue title"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is True
-        
-        # Different issue should not be suppressed
-        diff_issue = {"title": "Different issue"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, diff_issue)
-        assert should_skip is False
+    # Each case is (posted_locations, queries); a query is
+    # (file_path, line, issue, expected) where expected is None when the
+    # location must not be suppressed, else (skip_reason, matched line)
+    @pytest.mark.parametrize(
+        "posted_locations, queries",
+        [
+            # 2-tuples (backward compatibility): without issue metadata,
+            # proximity alone never suppresses
+            (
+                {("app/main.py", 10), ("app/utils.py", 25)},
+                [
+                    ("app/main.py", 10, None, None),
+                    ("app/main.py", 12, None, None),
+                    ("app/main.py", 20, None, None),
+                    ("app/other.py", 10, None, None),
+                ],
+            ),
+            # 3-tuples (current format with body_snippet)
+            (
+                {("app/main.py", 10, "Missing alt text"), ("app/utils.py", 25, "No ARIA label")},
+                [
+                    ("app/main.py", 10, None, None),
+                    (
+                        "app/main.py",
+                        10,
+                        {"title": "Missing alt text", "file": "app/main.py", "line": 10},
+                        ("exact title match", 10),
+                    ),
+                    # Different issue at a nearby location is not suppressed
+                    (
+                        "app/main.py",
+                        8,
+                        {"title": "Different issue", "file": "app/main.py", "line": 8},
+                        None,
+                    ),
+                ],
+            ),
+            # 4+ tuples (extended format)
+            (
+                {("app/main.py", 10, "Missing alt text", "extra_data")},
+                [("app/main.py", 10, {"title": "Missing alt text"}, ("exact title match", 10))],
+            ),
+            # Dicts with 'file' key
+            (
+                [{"file": "app/main.py", "line": 10, "snippet": "Button missing label"}],
+                [("app/main.py", 10, {"title": "Button missing label"}, ("exact title match", 10))],
+            ),
+            # Dicts with 'path' key
+            (
+                [{"path": "app/main.py", "line": 10, "snippet": "Icon without alt"}],
+                [("app/main.py", 10, {"title": "Icon without alt"}, ("exact title match", 10))],
+            ),
+            # Mixed formats
+            (
+                [
+                    ("app/main.py", 10),
+                    ("app/utils.py", 25, "No ARIA label"),
+                    ("app/helpers.py", 50, "Missing alt", "extra"),
+                    ["app/models.py", 15],
+                ],
+                [("app/utils.py", 23, {"title": "No ARIA label"}, ("exact title match", 25))],
+            ),
+            # Malformed entries are skipped safely
+            (
+                [
+                    ("app/main.py", 10, "Issue title"),  # Valid
+                    ("single_value",),  # Malformed: only 1 value
+                    (),  # Malformed: empty tuple
+                    "not_a_tuple",  # Malformed: string
+                    123,  # Malformed: number
+                    None,  # Malformed: None
+                ],
+                [
+                    ("app/main.py", 10, {"title": "Issue title"}, ("exact title match", 10)),
+                    ("app/main.py", 10, {"title": "Different issue"}, None),
+                ],
+            ),
+            # Empty posted_locations
+            (set(), [("app/main.py", 10, {"title": "Some issue"}, None)]),
+            # Dicts with missing keys are skipped
+            (
+                [
+                    {"path": "app/main.py", "line": 10, "snippet": "Valid issue"},  # Valid
+                    {"file": "app/utils.py"},  # Missing line
+                    {"line": 25},  # Missing file/path
+                    {},  # Empty dict
+                ],
+                [
+                    ("app/main.py", 10, {"title": "Valid issue"}, ("exact title match", 10)),
+                    ("app/utils.py", 10, {"title": "Any issue"}, None),
+                ],
+            ),
+        ],
+        ids=[
+            "2tuple",
+            "3tuple",
+            "4tuple",
+            "dict_file",
+            "dict_path",
+            "mixed",
+            "malformed",
+            "empty",
+            "dict_missing_keys",
+        ],
+    )
+    def test_posted_location_formats(self, posted_locations, queries):
+        """Test every supported posted_locations entry shape, skipping malformed ones."""
+        for file_path, line, issue, expected in queries:
+            should_skip, reason, matched = _is_near(
+                index_posted_locations(posted_locations), file_path, line, issue
+            )
+            if expected is None:
+                assert (should_skip, matched) == (False, None)
+            else:
+                assert should_skip is True
+                assert (reason, matched["line"]) == expected
 
     def test_near_line_behavior(self):
         """Test that near-line detection works correctly with issue identity."""
@@ -334,41 +179,40 @@ class TestIsNearExistingComment:
         should_skip, reason, matched = is_near_existing_comment("app/main.py", 12, diff_issue)
         assert should_skip is False
 
-    def test_empty_posted_locations(self):
-        """Test with empty posted_locations set."""
-        posted_locations = set()
-
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
-        )
-
-        # Should return False for any query
-        issue = {"title": "Some issue"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is False
-
-    def test_dict_with_missing_keys(self):
-        """Test that dicts with missing keys are skipped."""
+    def test_index_posted_locations(self):
+        """Test that locations are grouped by file, sorted by line, and malformed ones dropped."""
         posted_locations = [
-            {"path": "app/main.py", "line": 10, "snippet": "Valid issue"},  # Valid
-            {"file": "app/utils.py"},  # Missing line
-            {"line": 25},  # Missing file/path
-            {},  # Empty dict
+            ("app/main.py", 30, "Later issue"),
+            {"path": "app/main.py", "line": 10, "snippet": "Earlier issue"},
+            ("app/utils.py", 5),
+            ("app/main.py", "12", "Non-numeric line"),
+            {"file": "app/utils.py"},
+            None,
         ]
 
-        is_near_existing_comment = _create_is_near_existing_comment_function(
-            posted_locations
+        assert index_posted_locations(posted_locations) == {
+            "app/main.py": [
+                PostedLocation(10, "Earlier issue", "earlier issue", "earlierissue"),
+                PostedLocation(30, "Later issue", "later issue", "laterissue"),
+            ],
+            "app/utils.py": [PostedLocation(5, "", "", "")],
+        }
+
+    def test_index_reused_across_checks(self):
+        """Test that one index answers checks against several files and lines."""
+        locations_by_file = index_posted_locations(
+            {
+                ("app/main.py", 10, "TextField missing label"),
+                ("app/main.py", 40, "TextField missing label"),
+                ("app/other.py", 12, "TextField missing label"),
+            }
         )
+        issue = {"title": "TextField missing label"}
 
-        # Should find the valid dict entry with matching issue
-        issue = {"title": "Valid issue"}
-        should_skip, reason, matched = is_near_existing_comment("app/main.py", 10, issue)
-        assert should_skip is True
-        
-        # Should not match malformed entries
-        issue2 = {"title": "Any issue"}
-        should_skip, reason, matched = is_near_existing_comment("app/utils.py", 10, issue2)
-        assert should_skip is False
+        assert _is_near(locations_by_file, "app/main.py", 12, issue)[2]["line"] == 10
+        assert _is_near(locations_by_file, "app/main.py", 38, issue)[2]["line"] == 40
+        assert _is_near(locations_by_file, "app/main.py", 25, issue)[0] is False
+        assert _is_near(locations_by_file, "app/other.py", 8, issue)[2]["line"] == 12
 
 
 class TestRefinedDeduplicationLogic:
@@ -595,6 +439,15 @@ class TestRefinedDeduplicationLogic:
         # Call with None issue (backward compat)
         should_skip, reason, matched = is_near_existing_comment("app/main.py", 102, None)
         assert should_skip is False
+
+    def test_without_issue_identity_skips_lookup(self):
+        """Test that an issue without title or anchor returns before reading the index."""
+        locations_by_file = Mock()
+
+        for issue in (None, {}, {"title": "  ", "anchor_text": ""}):
+            assert _is_near(locations_by_file, "app/main.py", 100, issue) == (False, "", None)
+
+        locations_by_file.get.assert_not_called()
     
     def test_anchor_matched_text_priority(self):
         """